@@ -0,0 +1,77 @@
+"""
+Чистые функции вычисления флагов процессора
+Принимают 32-битные значения и возвращают кортеж (Z, S, C, O, P) в порядке FLAG_NAMES;
+методы Flags только маскируют аргументы и присваивают результат слотам
+"""
+
+from cpu_emulator.core.exceptions import FlagException
+
+MASK32 = 0xFFFFFFFF
+
+# Флаг четности для каждого значения байта: 1 при четном количестве единиц
+PARITY_LUT = bytes((i.bit_count() & 1) ^ 1 for i in range(256))
+
+
+def zsp(result: int) -> tuple[int, int, int]:
+    """Флаги Z, S и P (четность младшего байта) результата"""
+    return int(result == 0), result >> 31, PARITY_LUT[result & 0xFF]
+
+
+def add_carry_overflow(a: int, b: int, result: int) -> tuple[int, int]:
+    """C и O для сложения: C — 33-й бит суммы, O — результат сменил знак обоих операндов"""
+    return (a + b) >> 32, ((a ^ result) & (b ^ result)) >> 31
+
+
+def sub_carry_overflow(a: int, b: int, result: int) -> tuple[int, int]:
+    """C и O для вычитания: C — заём (знак разности), O — знаки операндов разные, а знак результата не как у a"""
+    return ((a - b) >> 32) & 1, ((a ^ b) & (a ^ result)) >> 31
+
+
+# Идентификаторы арифметических операций — индексы в ARITH_OPS
+OP_ADD = 0
+OP_SUB = 1
+OP_CMP = 2
+
+# CMP — то же вычитание без сохранения результата
+ARITH_OPS = (add_carry_overflow, sub_carry_overflow, sub_carry_overflow)
+
+# Строковые имена операций: переводятся в OP_* один раз в Flags.arithmetic_update
+STR_TO_ID = {"ADD": OP_ADD, "SUB": OP_SUB, "CMP": OP_CMP}
+
+
+def arithmetic_flags(a: int, b: int, result: int, op_id: int) -> tuple[int, ...]:
+    """Флаги арифметической операции по идентификатору OP_ADD, OP_SUB или OP_CMP"""
+    if not 0 <= op_id < len(ARITH_OPS):
+        raise FlagException(f"Unknown arithmetic operation: {op_id}")
+    carry, overflow = ARITH_OPS[op_id](a, b, result)
+    return int(result == 0), result >> 31, carry, overflow, PARITY_LUT[result & 0xFF]
+
+
+def logical_flags(result: int) -> tuple[int, ...]:
+    """Флаги логической операции: C и O сбрасываются"""
+    return int(result == 0), result >> 31, 0, 0, PARITY_LUT[result & 0xFF]
+
+
+def shift_flags(result: int, carry_out: int) -> tuple[int, ...]:
+    """Флаги сдвига или поворота: C — выдвинутый бит, O сбрасывается"""
+    return int(result == 0), result >> 31, carry_out & 1, 0, PARITY_LUT[result & 0xFF]
+
+
+def shift_left_carry(original: int, count: int) -> int:
+    """Последний бит, выдвинутый сдвигом влево: 33-й бит original << count, без ветвлений; 0 при count 0 и count > 32"""
+    return (((original & MASK32) << count) >> 32) & 1
+
+
+def shift_right_carry(original: int, count: int) -> int:
+    """Последний бит, выдвинутый сдвигом вправо: бит count - 1, без ветвлений; 0 при count 0"""
+    return ((original << 1) >> count) & 1
+
+
+def multiplication_flags(result: int, full_result: int) -> tuple[int, ...]:
+    """Флаги умножения: C — полный результат не помещается в 32 бита, O не определен (0)"""
+    return int(result == 0), result >> 31, int(full_result > MASK32), 0, PARITY_LUT[result & 0xFF]
+
+
+def division_flags(quotient: int) -> tuple[int, ...]:
+    """Флаги деления по частному: C и O не устанавливаются"""
+    return int(quotient == 0), quotient >> 31, 0, 0, PARITY_LUT[quotient & 0xFF]
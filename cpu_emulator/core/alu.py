@@ -1,6 +1,6 @@
 from loguru import logger
 
-from cpu_emulator.core.flags import Flags
+from cpu_emulator.core.flags import OP_ADD, OP_CMP, OP_SUB, Flags
 from cpu_emulator.core.registers import Registers
 
 
@@ -16,7 +16,7 @@ class ALU:
         a = a & 0xFFFFFFFF
         b = b & 0xFFFFFFFF
         result = (a + b) & 0xFFFFFFFF
-        self.flags.arithmetic_update(a, b, result, "ADD")
+        self.flags.update_arith(a, b, result, OP_ADD)
         logger.debug(f"ADD: 0x{a:08X} + 0x{b:08X} = 0x{result:08X}")
         return result
 
@@ -25,7 +25,7 @@ class ALU:
         a = a & 0xFFFFFFFF
         b = b & 0xFFFFFFFF
         result = (a - b) & 0xFFFFFFFF
-        self.flags.arithmetic_update(a, b, result, "SUB")
+        self.flags.update_arith(a, b, result, OP_SUB)
         logger.debug(f"SUB: 0x{a:08X} - 0x{b:08X} = 0x{result:08X}")
         return result
 
@@ -65,7 +65,7 @@ class ALU:
         a = a & 0xFFFFFFFF
         b = b & 0xFFFFFFFF
         result = (a - b) & 0xFFFFFFFF
-        self.flags.arithmetic_update(a, b, result, "CMP")
+        self.flags.update_arith(a, b, result, OP_CMP)
         logger.debug(f"CMP: 0x{a:08X} vs 0x{b:08X}")
 
     # Логические операции
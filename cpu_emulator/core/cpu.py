@@ -3,6 +3,8 @@
 Фон-неймановская архитектура с двухадресными командами
 """
 
+from collections.abc import Callable
+from typing import NamedTuple
 
 from loguru import logger
 
@@ -27,6 +29,18 @@ class InvalidInstructionException(CPUException):
     pass
 
 
+class CPUState(NamedTuple):
+    """Снимок состояния CPU: значения регистров R0-R8 и флагов в порядке FLAG_NAMES"""
+
+    registers: tuple[int, ...]
+    pc: int
+    sp: int
+    flags: tuple[int, ...]
+    running: bool
+    halted: bool
+    cycle_count: int
+
+
 class CPU:
     """
     Центральный процессор эмулятора
@@ -52,28 +66,51 @@ class CPU:
         self.flags = Flags()
         self.alu = ALU(self.registers, self.flags)
         self.decoder = InstructionDecoder()
+        # Кэш декодирования: команда зависит только от 32-битного слова,
+        # поэтому повторно исполняемый код (циклы) декодируется один раз
+        self._decode_cache: dict[int, Instruction] = {}
+        self._handlers = self._build_handlers()
 
         # Состояние CPU
         self.running = False
         self.halted = False
         self.cycle_count = 0
+        # Состояние изменилось с момента последнего чтения (сбрасывает наблюдатель, например GUI)
+        self.dirty = True
 
         # Настройка стека
         self.stack_base = memory_size - stack_size  # Стек растет вниз от конца памяти
         self.registers.sp = self.stack_base
 
+        # Диапазон памяти [lo, hi), записанный программой (load_program и STORE):
+        # reset(clear_memory=True) обнуляет только его
+        self._dirty_lo = memory_size
+        self._dirty_hi = 0
+
         logger.info(
             f"CPU initialized: memory={memory_size}B, stack_base=0x{self.stack_base:05X}"
         )
 
-    def reset(self) -> None:
-        """Сброс CPU в начальное состояние"""
+    def reset(self, clear_memory: bool = False) -> None:
+        """
+        Сброс CPU в начальное состояние
+
+        Args:
+            clear_memory: Обнулить память, записанную через load_program и STORE
+                (для повторного использования CPU)
+        """
+        if clear_memory:
+            if self._dirty_lo < self._dirty_hi:
+                self.memory.clear(self._dirty_lo, self._dirty_hi)
+            self._dirty_lo = self.memory.size
+            self._dirty_hi = 0
         self.registers.reset()
         self.flags.reset()
         self.running = False
         self.halted = False
         self.cycle_count = 0
         self.registers.sp = self.stack_base
+        self.dirty = True
 
         logger.info("CPU reset completed")
 
@@ -94,9 +131,13 @@ class CPU:
         # Загружаем программу в память
         for i, byte in enumerate(program):
             self.memory.write_byte(start_address + i, byte)
+        if program:
+            self._dirty_lo = min(self._dirty_lo, start_address)
+            self._dirty_hi = max(self._dirty_hi, start_address + len(program))
 
         # Устанавливаем PC на начало программы
         self.registers.pc = start_address
+        self.dirty = True
 
         logger.info(f"Program loaded: {len(program)} bytes at 0x{start_address:05X}")
 
@@ -135,13 +176,17 @@ class CPU:
         """Выполнить один цикл команды (Fetch-Decode-Execute)"""
         if self.halted:
             return
+        self.dirty = True
 
         try:
             # FETCH
             instruction_word = self.fetch_instruction()
 
             # DECODE
-            instruction = self.decoder.decode(instruction_word)
+            instruction = self._decode_cache.get(instruction_word)
+            if instruction is None:
+                instruction = self.decoder.decode(instruction_word)
+                self._decode_cache[instruction_word] = instruction
 
             # EXECUTE
             self.execute_instruction(instruction)
@@ -185,124 +230,86 @@ class CPU:
         opcode = instruction.opcode
         logger.debug(f"Executing: {instruction}")
 
+        handler = self._handlers.get(opcode)
         try:
-            # Системные команды
-            if opcode == OpCode.NOP:
-                pass  # Ничего не делаем
-
-            elif opcode == OpCode.HALT:
-                self.halted = True
-                self.running = False
-                logger.info("CPU halted by HALT instruction")
+            if handler is None:
+                raise InvalidInstructionException(
+                    f"Unimplemented instruction: {opcode}"
+                )
+            handler(instruction)
+        except Exception as e:
+            logger.error(f"Error executing {instruction}: {e}")
+            raise
 
+    def _build_handlers(self) -> dict[OpCode, Callable[[Instruction], None]]:
+        """Таблица обработчиков: опкод -> метод исполнения (один поиск вместо цепочки if/elif)"""
+        return {
+            # Системные команды
+            OpCode.NOP: self._execute_nop,
+            OpCode.HALT: self._execute_halt,
             # Команды перемещения данных
-            elif opcode == OpCode.MOV_REG:
-                self._execute_mov_reg(instruction)
-            elif opcode == OpCode.MOV_IMM:
-                self._execute_mov_imm(instruction)
-            elif opcode == OpCode.LOAD:
-                self._execute_load(instruction)
-            elif opcode == OpCode.STORE:
-                self._execute_store(instruction)
-
+            OpCode.MOV_REG: self._execute_mov_reg,
+            OpCode.MOV_IMM: self._execute_mov_imm,
+            OpCode.LOAD: self._execute_load,
+            OpCode.STORE: self._execute_store,
             # Арифметические команды
-            elif opcode == OpCode.ADD_REG:
-                self._execute_add_reg(instruction)
-            elif opcode == OpCode.ADD_IMM:
-                self._execute_add_imm(instruction)
-            elif opcode == OpCode.SUB_REG:
-                self._execute_sub_reg(instruction)
-            elif opcode == OpCode.SUB_IMM:
-                self._execute_sub_imm(instruction)
-            elif opcode == OpCode.MUL_REG:
-                self._execute_mul_reg(instruction)
-            elif opcode == OpCode.MUL_IMM:
-                self._execute_mul_imm(instruction)
-            elif opcode == OpCode.DIV_REG:
-                self._execute_div_reg(instruction)
-            elif opcode == OpCode.DIV_IMM:
-                self._execute_div_imm(instruction)
-
+            OpCode.ADD_REG: self._execute_add_reg,
+            OpCode.ADD_IMM: self._execute_add_imm,
+            OpCode.SUB_REG: self._execute_sub_reg,
+            OpCode.SUB_IMM: self._execute_sub_imm,
+            OpCode.MUL_REG: self._execute_mul_reg,
+            OpCode.MUL_IMM: self._execute_mul_imm,
+            OpCode.DIV_REG: self._execute_div_reg,
+            OpCode.DIV_IMM: self._execute_div_imm,
             # Логические команды
-            elif opcode == OpCode.AND_REG:
-                self._execute_and_reg(instruction)
-            elif opcode == OpCode.AND_IMM:
-                self._execute_and_imm(instruction)
-            elif opcode == OpCode.OR_REG:
-                self._execute_or_reg(instruction)
-            elif opcode == OpCode.OR_IMM:
-                self._execute_or_imm(instruction)
-            elif opcode == OpCode.XOR_REG:
-                self._execute_xor_reg(instruction)
-            elif opcode == OpCode.XOR_IMM:
-                self._execute_xor_imm(instruction)
-            elif opcode == OpCode.NOT:
-                self._execute_not(instruction)
-
+            OpCode.AND_REG: self._execute_and_reg,
+            OpCode.AND_IMM: self._execute_and_imm,
+            OpCode.OR_REG: self._execute_or_reg,
+            OpCode.OR_IMM: self._execute_or_imm,
+            OpCode.XOR_REG: self._execute_xor_reg,
+            OpCode.XOR_IMM: self._execute_xor_imm,
+            OpCode.NOT: self._execute_not,
             # Команды сдвига
-            elif opcode == OpCode.SHL_REG:
-                self._execute_shl_reg(instruction)
-            elif opcode == OpCode.SHL_IMM:
-                self._execute_shl_imm(instruction)
-            elif opcode == OpCode.SHR_REG:
-                self._execute_shr_reg(instruction)
-            elif opcode == OpCode.SHR_IMM:
-                self._execute_shr_imm(instruction)
-            elif opcode == OpCode.SAR_REG:
-                self._execute_sar_reg(instruction)
-            elif opcode == OpCode.SAR_IMM:
-                self._execute_sar_imm(instruction)
-
+            OpCode.SHL_REG: self._execute_shl_reg,
+            OpCode.SHL_IMM: self._execute_shl_imm,
+            OpCode.SHR_REG: self._execute_shr_reg,
+            OpCode.SHR_IMM: self._execute_shr_imm,
+            OpCode.SAR_REG: self._execute_sar_reg,
+            OpCode.SAR_IMM: self._execute_sar_imm,
             # Команды сравнения
-            elif opcode == OpCode.CMP_REG:
-                self._execute_cmp_reg(instruction)
-            elif opcode == OpCode.CMP_IMM:
-                self._execute_cmp_imm(instruction)
-
+            OpCode.CMP_REG: self._execute_cmp_reg,
+            OpCode.CMP_IMM: self._execute_cmp_imm,
             # Команды переходов
-            elif opcode == OpCode.JMP:
-                self._execute_jmp(instruction)
-            elif opcode == OpCode.JZ:
-                self._execute_jz(instruction)
-            elif opcode == OpCode.JNZ:
-                self._execute_jnz(instruction)
-            elif opcode == OpCode.JC:
-                self._execute_jc(instruction)
-            elif opcode == OpCode.JNC:
-                self._execute_jnc(instruction)
-            elif opcode == OpCode.JS:
-                self._execute_js(instruction)
-            elif opcode == OpCode.JNS:
-                self._execute_jns(instruction)
-
+            OpCode.JMP: self._execute_jmp,
+            OpCode.JZ: self._execute_jz,
+            OpCode.JNZ: self._execute_jnz,
+            OpCode.JC: self._execute_jc,
+            OpCode.JNC: self._execute_jnc,
+            OpCode.JS: self._execute_js,
+            OpCode.JNS: self._execute_jns,
             # Команды длинной арифметики
-            elif opcode == OpCode.ADDC_REG:
-                self._execute_addc_reg(instruction)
-            elif opcode == OpCode.ADDC_IMM:
-                self._execute_addc_imm(instruction)
-            elif opcode == OpCode.SUBC_REG:
-                self._execute_subc_reg(instruction)
-            elif opcode == OpCode.SUBC_IMM:
-                self._execute_subc_imm(instruction)
-            elif opcode == OpCode.CLC:
-                self._execute_clc(instruction)
-            elif opcode == OpCode.STC:
-                self._execute_stc(instruction)
-
+            OpCode.ADDC_REG: self._execute_addc_reg,
+            OpCode.ADDC_IMM: self._execute_addc_imm,
+            OpCode.SUBC_REG: self._execute_subc_reg,
+            OpCode.SUBC_IMM: self._execute_subc_imm,
+            OpCode.CLC: self._execute_clc,
+            OpCode.STC: self._execute_stc,
             # В RISC-V стиле нет отдельных PUSH/POP команд
             # Стековые операции выполняются через базовые инструкции:
             # PUSH R1 ≡ SUB R8, R8, #4; STORE [R8], R1
             # POP R1  ≡ LOAD R1, [R8]; ADD R8, R8, #4
             # где R8 - это указатель стека (SP)
+        }
 
-            else:
-                raise InvalidInstructionException(
-                    f"Unimplemented instruction: {opcode}"
-                )
+    # Реализация системных команд
+    def _execute_nop(self, instruction: Instruction) -> None:
+        """NOP - ничего не делаем"""
 
-        except Exception as e:
-            logger.error(f"Error executing {instruction}: {e}")
-            raise
+    def _execute_halt(self, instruction: Instruction) -> None:
+        """HALT - остановка процессора"""
+        self.halted = True
+        self.running = False
+        logger.info("CPU halted by HALT instruction")
 
     # Реализация команд перемещения данных
     def _execute_mov_reg(self, instruction: Instruction) -> None:
@@ -325,6 +332,11 @@ class CPU:
         address = self.registers[instruction.dest_reg]
         value = self.registers[instruction.source_reg]
         self.memory.write_word(address, value)
+        # Записанный диапазон отслеживается только здесь, а не в каждом Memory.write_*
+        if address < self._dirty_lo:
+            self._dirty_lo = address
+        if address + 4 > self._dirty_hi:
+            self._dirty_hi = address + 4
 
     # Реализация арифметических команд (двухадресные)
     def _execute_add_reg(self, instruction: Instruction) -> None:
@@ -485,32 +497,32 @@ class CPU:
 
     def _execute_jz(self, instruction: Instruction) -> None:
         """JZ addr - переход если Zero flag"""
-        if self.flags["Z"]:
+        if self.flags.Z:
             self.registers.pc = instruction.address
 
     def _execute_jnz(self, instruction: Instruction) -> None:
         """JNZ addr - переход если не Zero flag"""
-        if not self.flags["Z"]:
+        if not self.flags.Z:
             self.registers.pc = instruction.address
 
     def _execute_jc(self, instruction: Instruction) -> None:
         """JC addr - переход если Carry flag"""
-        if self.flags["C"]:
+        if self.flags.C:
             self.registers.pc = instruction.address
 
     def _execute_jnc(self, instruction: Instruction) -> None:
         """JNC addr - переход если не Carry flag"""
-        if not self.flags["C"]:
+        if not self.flags.C:
             self.registers.pc = instruction.address
 
     def _execute_js(self, instruction: Instruction) -> None:
         """JS addr - переход если Sign flag"""
-        if self.flags["S"]:
+        if self.flags.S:
             self.registers.pc = instruction.address
 
     def _execute_jns(self, instruction: Instruction) -> None:
         """JNS addr - переход если не Sign flag"""
-        if not self.flags["S"]:
+        if not self.flags.S:
             self.registers.pc = instruction.address
 
     # Реализация команд длинной арифметики
@@ -553,17 +565,16 @@ class CPU:
     # POP R1:  LOAD R1, [R8]; ADD R8, R8, #4
     # где R8 - указатель стека (SP)
 
-    def get_state(self) -> dict:
-        """Получить текущее состояние CPU для отладки"""
-        registers = {f"R{i}": self.registers[i] for i in range(8)}
-        registers["R8"] = self.registers[8]  # SP как R8 в RISC-V стиле
-
-        return {
-            "registers": registers,
-            "pc": self.registers.pc,
-            "sp": self.registers.sp,
-            "flags": {flag: self.flags[flag] for flag in ["Z", "S", "C", "O", "P"]},
-            "running": self.running,
-            "halted": self.halted,
-            "cycle_count": self.cycle_count,
-        }
+    def get_state(self) -> CPUState:
+        """Получить текущее состояние CPU для отладки (R8 — SP в RISC-V стиле)"""
+        registers = self.registers
+        flags = self.flags
+        return CPUState(
+            tuple(registers[i] for i in range(9)),
+            registers.pc,
+            registers.sp,
+            flags.snapshot(),
+            self.running,
+            self.halted,
+            self.cycle_count,
+        )
@@ -1,81 +1,128 @@
+from types import MappingProxyType
+
 from loguru import logger
 
+from cpu_emulator.core._flag_ops import (
+    OP_ADD,
+    OP_CMP,
+    OP_SUB,
+    PARITY_LUT,
+    STR_TO_ID,
+    arithmetic_flags,
+    division_flags,
+    logical_flags,
+    multiplication_flags,
+    shift_flags,
+    shift_left_carry,
+    shift_right_carry,
+    zsp,
+)
 from cpu_emulator.core.exceptions import FlagException
 
+FLAG_NAMES = ("Z", "S", "C", "O", "P")
+
+# OP_* реэкспортируются для ALU и вызывающего кода
+__all__ = ["FLAG_NAMES", "OP_ADD", "OP_CMP", "OP_SUB", "Flags"]
+
 
 class Flags:
-    def __init__(self):
-        self.flags = {
-            "Z": 0,  # Zero flag
-            "S": 0,  # Sign flag
-            "C": 0,  # Carry flag
-            "O": 0,  # Overflow flag
-            "P": 0,  # Parity flag
-        }
+    # Флаги хранятся в слотах: чтение flags.Z — доступ по смещению, без словаря
+    __slots__ = FLAG_NAMES
+
+    def __init__(self) -> None:
+        self.Z = 0  # Zero flag
+        self.S = 0  # Sign flag
+        self.C = 0  # Carry flag
+        self.O = 0  # Overflow flag
+        self.P = 0  # Parity flag
+
+    @property
+    def flags(self) -> MappingProxyType[str, int]:
+        """Снимок флагов только для чтения; изменять флаги — через set() или flags[name] = value"""
+        return MappingProxyType({name: getattr(self, name) for name in FLAG_NAMES})
+
+    def snapshot(self) -> tuple[int, int, int, int, int]:
+        """Все флаги одним кортежем в порядке FLAG_NAMES"""
+        return self.Z, self.S, self.C, self.O, self.P
 
     def get(self, flag_name: str) -> int:
-        self._check_flag(flag_name)
-        value = self.flags[flag_name]
+        # Фиксированный набор имён: прямое чтение слота без getattr по строке
+        match flag_name:
+            case "Z":
+                value = self.Z
+            case "S":
+                value = self.S
+            case "C":
+                value = self.C
+            case "O":
+                value = self.O
+            case "P":
+                value = self.P
+            case _:
+                raise FlagException(f"Unknown flag: {flag_name}")
         logger.debug(f"Read flag {flag_name} got 0x{value:08X}")
         return value
 
     def set(self, flag_name: str, value: int) -> None:
-        self._check_flag(flag_name)
-        self.flags[flag_name] = value
+        match flag_name:
+            case "Z":
+                self.Z = value
+            case "S":
+                self.S = value
+            case "C":
+                self.C = value
+            case "O":
+                self.O = value
+            case "P":
+                self.P = value
+            case _:
+                raise FlagException(f"Unknown flag: {flag_name}")
         logger.debug(f"Set flag {flag_name} to {value}")
 
     def basic_update(self, op_result: int) -> None:
-        op_result = op_result & 0xFFFFFFFF
-        self.flags["Z"] = 1 if op_result == 0 else 0
-        # проверяем, что установлен старший бит
-        self.flags["S"] = 1 if op_result & 0x80000000 else 0
-        # вычисляем четность младших 8 бит
-        self.flags["P"] = self._calculate_parity(op_result & 0xFF)
+        self.Z, self.S, self.P = zsp(op_result & 0xFFFFFFFF)
         logger.debug(
-            f"Updated flags: Z={self.flags['Z']}, S={self.flags['S']}, P={self.flags['P']}"
+            f"Updated flags: Z={self.Z}, S={self.S}, P={self.P}"
         )
 
-    def arithmetic_update(self, a: int, b: int, result: int, operation: str) -> None:
-        a = a & 0xFFFFFFFF
-        b = b & 0xFFFFFFFF
-        result = result & 0xFFFFFFFF
-
-        self.basic_update(result)
+    def arithmetic_update(
+        self, a: int, b: int, result: int, operation: int | str
+    ) -> None:
+        """Совместимый вход: маскирует аргументы, переводит имя операции в OP_* и вызывает update_arith"""
+        if isinstance(operation, str):
+            op_id = STR_TO_ID.get(operation)
+            if op_id is None:
+                raise FlagException(f"Unknown arithmetic operation: {operation}")
+            operation = op_id
+        self.update_arith(
+            a & 0xFFFFFFFF, b & 0xFFFFFFFF, result & 0xFFFFFFFF, operation
+        )
 
-        if operation == "ADD":
-            self._update_flags_for_add(a, b, result)
-        elif operation == "SUB":
-            self._update_flags_for_sub(a, b, result)
-        elif operation == "CMP":
-            self._update_flags_for_sub(a, b, a - b)
+    def update_arith(self, a: int, b: int, result: int, op_id: int) -> None:
+        """Быстрый путь ALU: a, b, result уже 32-битные, op_id — OP_ADD, OP_SUB или OP_CMP"""
+        self.Z, self.S, self.C, self.O, self.P = arithmetic_flags(a, b, result, op_id)
 
         logger.debug(
-            f"Arithmetic flags updated: Z={self.flags['Z']}, S={self.flags['S']}, "
-            f"C={self.flags['C']}, O={self.flags['O']}"
+            f"Arithmetic flags updated: Z={self.Z}, S={self.S}, "
+            f"C={self.C}, O={self.O}"
         )
 
     def logical_update(self, result: int) -> None:
         """Обновление флагов для логических операций (AND, OR, XOR, NOT)"""
-        result = result & 0xFFFFFFFF
-        self.basic_update(result)
         # Логические операции сбрасывают флаги переноса и переполнения
-        self.flags["C"] = 0
-        self.flags["O"] = 0
+        self.Z, self.S, self.C, self.O, self.P = logical_flags(result & 0xFFFFFFFF)
         logger.debug(
-            f"Logical flags updated: Z={self.flags['Z']}, S={self.flags['S']}, "
-            f"C={self.flags['C']}, O={self.flags['O']}, P={self.flags['P']}"
+            f"Logical flags updated: Z={self.Z}, S={self.S}, "
+            f"C={self.C}, O={self.O}, P={self.P}"
         )
 
     def shift_update(self, result: int, carry_out: int = 0) -> None:
         """Обновление флагов для операций сдвига"""
-        result = result & 0xFFFFFFFF
-        self.basic_update(result)
-        self.flags["C"] = carry_out & 1
         # Для сдвигов флаг переполнения обычно не определен или равен 0
-        self.flags["O"] = 0
+        self.Z, self.S, self.C, self.O, self.P = shift_flags(result & 0xFFFFFFFF, carry_out)
         logger.debug(
-            f"Shift flags updated: Z={self.flags['Z']}, S={self.flags['S']}, "
-            f"C={self.flags['C']}, O={self.flags['O']}, P={self.flags['P']}"
+            f"Shift flags updated: Z={self.Z}, S={self.S}, "
+            f"C={self.C}, O={self.O}, P={self.P}"
         )
 
     def shift_left_update(self, original: int, count: int, result: int) -> None:
@@ -84,8 +131,7 @@ class Flags:
             self.basic_update(result)
             return
 
-        carry_out = (original >> (32 - count)) & 1 if count <= 32 else 0
-        self.shift_update(result, carry_out)
+        self.shift_update(result, shift_left_carry(original, count))
 
     def shift_right_update(self, original: int, count: int, result: int) -> None:
         """Обновление флагов для логического сдвига вправо"""
@@ -93,8 +139,7 @@ class Flags:
             self.basic_update(result)
             return
 
-        carry_out = (original >> (count - 1)) & 1 if count > 0 else 0
-        self.shift_update(result, carry_out)
+        self.shift_update(result, shift_right_carry(original, count))
 
     def rotate_update(self, result: int, carry_out: int = 0) -> None:
         """Обновление флагов для операций поворота"""
@@ -102,79 +147,31 @@ class Flags:
 
     def multiplication_update(self, result: int, full_result: int) -> None:
         """Обновление флагов для операции умножения"""
-        result = result & 0xFFFFFFFF
-        self.basic_update(result)
-        # Флаг переноса устанавливается, если результат не помещается в 32 бита
-        self.flags["C"] = 1 if full_result > 0xFFFFFFFF else 0
-        # Флаг переполнения для умножения обычно не определен
-        self.flags["O"] = 0
+        # C — результат не помещается в 32 бита, O для умножения не определен
+        self.Z, self.S, self.C, self.O, self.P = multiplication_flags(
+            result & 0xFFFFFFFF, full_result
+        )
         logger.debug(
-            f"Multiplication flags updated: Z={self.flags['Z']}, S={self.flags['S']}, "
-            f"C={self.flags['C']}, O={self.flags['O']}, P={self.flags['P']}"
+            f"Multiplication flags updated: Z={self.Z}, S={self.S}, "
+            f"C={self.C}, O={self.O}, P={self.P}"
         )
 
     def division_update(self, quotient: int) -> None:
         """Обновление флагов для операции деления"""
-        quotient = quotient & 0xFFFFFFFF
-        self.basic_update(quotient)
         # Деление не устанавливает флаги переноса и переполнения
-        self.flags["C"] = 0
-        self.flags["O"] = 0
+        self.Z, self.S, self.C, self.O, self.P = division_flags(quotient & 0xFFFFFFFF)
         logger.debug(
-            f"Division flags updated: Z={self.flags['Z']}, S={self.flags['S']}, "
-            f"C={self.flags['C']}, O={self.flags['O']}, P={self.flags['P']}"
+            f"Division flags updated: Z={self.Z}, S={self.S}, "
+            f"C={self.C}, O={self.O}, P={self.P}"
         )
 
     def reset(self) -> None:
-        for flag in self.flags:
-            self.flags[flag] = 0
-        logger.debug(f"Reset flags: {self.flags}")
-
-    def _check_flag(self, flag_name: str) -> None:
-        if self.flags.get(flag_name) is None:
-            raise FlagException(f"Unknown flag: {flag_name}")
-
-    def _update_flags_for_add(self, a: int, b: int, result: int) -> None:
-        # Carry flag (unsigned overflow)
-        # Происходит, когда сумма больше 0xFFFFFFFF
-        unsigned_sum = a + b
-        self.flags["C"] = 1 if unsigned_sum > 0xFFFFFFFF else 0
-
-        # Overflow flag (signed overflow)
-        # Происходит, когда складываем два числа одного знака,
-        # а результат другого знака
-        a_signed = a if a < 0x80000000 else a - 0x100000000
-        b_signed = b if b < 0x80000000 else b - 0x100000000
-        result_signed = result if result < 0x80000000 else result - 0x100000000
-
-        # Overflow: если оба операнда одного знака, а результат другого
-        same_sign_operands = (a_signed >= 0) == (b_signed >= 0)
-        different_sign_result = (a_signed >= 0) != (result_signed >= 0)
-
-        self.flags["O"] = 1 if same_sign_operands and different_sign_result else 0
-
-    def _update_flags_for_sub(self, a: int, b: int, result: int) -> None:
-        self.flags["C"] = 1 if a < b else 0
-
-        # Overflow flag для вычитания
-        # Происходит, когда операнды разных знаков, а результат не соответствует
-        a_signed = a if a < 0x80000000 else a - 0x100000000
-        b_signed = b if b < 0x80000000 else b - 0x100000000
-        result_signed = result if result < 0x80000000 else result - 0x100000000
-
-        # Overflow: если операнды разных знаков, а результат не соответствует первому
-        different_signs = (a_signed >= 0) != (b_signed >= 0)
-        wrong_result = (a_signed >= 0) != (result_signed >= 0)
-
-        self.flags["O"] = 1 if different_signs and wrong_result else 0
+        self.Z = self.S = self.C = self.O = self.P = 0
+        logger.debug("Reset flags")
 
     def _calculate_parity(self, value: int) -> int:
-        """Вычисляет четность (1 для четного количества единиц, 0 для нечетного)"""
-        count = 0
-        while value:
-            count += value & 1
-            value >>= 1
-        return 1 if count % 2 == 0 else 0
+        """Вычисляет четность младшего байта (1 для четного количества единиц, 0 для нечетного)"""
+        return PARITY_LUT[value & 0xFF]
 
     def __getitem__(self, flag_name: str) -> int:
         return self.get(flag_name)
@@ -1,7 +1,12 @@
+import struct
+
 from loguru import logger
 
 from cpu_emulator.core.exceptions import BadAddressException
 
+# Формат слова разбирается один раз при импорте
+_WORD = struct.Struct("<I")
+
 
 class Memory:
     def __init__(self, size: int = 256 * 1024):
@@ -39,14 +44,8 @@ class Memory:
         :return: прочитанное слово в little endian порядке
         """
         self._check_word_address(address)
-        word_bytes = [self.read_byte(address + i) for i in range(4)]
-        # собираем в little endian порядке
-        word = (
-            (word_bytes[3] << 24)
-            | (word_bytes[2] << 16)
-            | (word_bytes[1] << 8)
-            | (word_bytes[0])
-        )
+        # собираем в little endian порядке одним вызовом struct
+        word: int = _WORD.unpack_from(self.memory, address)[0]
         logger.debug(f"Read word from 0x{address:05X} got 0x{word:02X}")
         return word
 
@@ -58,10 +57,42 @@ class Memory:
         :return: None
         """
         self._check_word_address(address)
-        for i in range(4):
-            self.write_byte(address + i, value >> (i * 8) & 0xFF)
+        _WORD.pack_into(self.memory, address, value & 0xFFFFFFFF)
         logger.debug(f"Write word 0x{value:08X} to 0x{address:05X}")
 
+    def read_range(self, address: int, length: int) -> bytes:
+        """
+        Читает непрерывный диапазон байт одним срезом
+        :param address: начальный адрес
+        :param length: количество байт
+        :return: копия диапазона памяти
+        """
+        if length < 0:
+            raise BadAddressException(f"Invalid length: {length}")
+        self._check_address_range(address, address + max(length, 1) - 1)
+        data = bytes(self.memory[address : address + length])
+        logger.debug(f"Read {length} bytes from 0x{address:05X}")
+        return data
+
+    def clear(self, start: int, end: int) -> None:
+        """
+        Обнуляет диапазон [start, end) одним присваиванием среза
+        :param start: начальный адрес
+        :param end: адрес за последним байтом
+        :return: None
+        """
+        self._check_address_range(start, end - 1)
+        self.memory[start:end] = bytes(end - start)
+        logger.debug(f"Memory cleared 0x{start:05X}..0x{end:05X}")
+
+    def reset(self) -> None:
+        """
+        Обнуляет всю память одним присваиванием среза, не перевыделяя буфер
+        :return: None
+        """
+        self.memory[:] = bytes(self.size)
+        logger.debug(f"Memory reset {self.size} bytes")
+
     def _check_address_range(self, address: int, end_address: int = 0) -> None:
         if not 0 <= address < self.size:
             raise BadAddressException(f"Invalid address: {address} out of range")
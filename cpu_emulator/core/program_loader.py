@@ -4,11 +4,13 @@
 """
 
 import struct
+from collections.abc import Callable, Sequence
+from functools import partial
 
 from loguru import logger
 
 from cpu_emulator.core.decoder import InstructionDecoder, create_instruction
-from cpu_emulator.core.instruction_set import OpCode
+from cpu_emulator.core.instruction_set import Instruction, OpCode
 
 
 class ProgramLoader:
@@ -20,11 +22,12 @@ class ProgramLoader:
     - Простой ассемблер (текстовые мнемоники)
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.decoder = InstructionDecoder()
+        self._ops = self._build_ops()
         logger.debug("ProgramLoader initialized")
 
-    def assemble_simple(self, assembly_lines: list[str]) -> bytes:
+    def assemble_simple(self, assembly_lines: Sequence[str]) -> bytes:
         """
         Простой ассемблер для базовых команд с поддержкой RISC-V стиля
 
@@ -52,9 +55,13 @@ class ProgramLoader:
                 if not line or line.startswith(";"):  # Пустые строки и комментарии
                     continue
 
-                # Обрабатываем PUSH/POP в RISC-V стиле
+                # Строка разбивается на токены один раз
                 parts = line.replace(",", "").split()
-                if parts and parts[0].upper() == "PUSH":
+                if not parts:  # Строка из одних запятых
+                    continue
+                mnemonic = parts[0].upper()
+                # Обрабатываем PUSH/POP в RISC-V стиле
+                if mnemonic == "PUSH":
                     # PUSH R1 → SUB R8, R8, #4; STORE [R8], R1
                     source_reg = self._parse_register(parts[1])
                     instructions.append(
@@ -65,7 +72,7 @@ class ProgramLoader:
                             OpCode.STORE, dest_reg=8, source_reg=source_reg
                         )
                     )
-                elif parts and parts[0].upper() == "POP":
+                elif mnemonic == "POP":
                     # POP R1 → LOAD R1, [R8]; ADD R8, R8, #4
                     dest_reg = self._parse_register(parts[1])
                     instructions.append(
@@ -76,7 +83,7 @@ class ProgramLoader:
                     )
                 else:
                     # Обычные команды
-                    instruction = self._parse_assembly_line(line)
+                    instruction = self._parse_assembly_line(parts)
                     if instruction:
                         instructions.append(instruction)
 
@@ -94,86 +101,59 @@ class ProgramLoader:
         )
         return bytes(machine_code)
 
-    def _parse_assembly_line(self, line: str):
-        """Парсинг одной строки ассемблера"""
-        parts = line.replace(",", "").split()
+    def _build_ops(self) -> dict[str, Callable[[list[str]], Instruction]]:
+        """Таблица мнемоник: мнемоника -> парсер операндов (один поиск вместо цепочки if/elif)"""
+        arithmetic = self._parse_arithmetic
+        jump = self._parse_jump
+        return {
+            # Системные команды
+            "NOP": lambda operands: create_instruction(OpCode.NOP),
+            "HALT": lambda operands: create_instruction(OpCode.HALT),
+            # Команды перемещения данных
+            "MOV": self._parse_mov,
+            "LOAD": self._parse_load,
+            "STORE": self._parse_store,
+            # Арифметические команды
+            "ADD": partial(arithmetic, OpCode.ADD_REG, OpCode.ADD_IMM),
+            "SUB": partial(arithmetic, OpCode.SUB_REG, OpCode.SUB_IMM),
+            "MUL": partial(arithmetic, OpCode.MUL_REG, OpCode.MUL_IMM),
+            "DIV": partial(arithmetic, OpCode.DIV_REG, OpCode.DIV_IMM),
+            # Логические команды
+            "AND": partial(arithmetic, OpCode.AND_REG, OpCode.AND_IMM),
+            "OR": partial(arithmetic, OpCode.OR_REG, OpCode.OR_IMM),
+            "XOR": partial(arithmetic, OpCode.XOR_REG, OpCode.XOR_IMM),
+            "NOT": self._parse_not,
+            # Команды сдвига
+            "SHL": partial(arithmetic, OpCode.SHL_REG, OpCode.SHL_IMM),
+            "SHR": partial(arithmetic, OpCode.SHR_REG, OpCode.SHR_IMM),
+            "SAR": partial(arithmetic, OpCode.SAR_REG, OpCode.SAR_IMM),
+            # Команды сравнения
+            "CMP": partial(arithmetic, OpCode.CMP_REG, OpCode.CMP_IMM),
+            # Команды переходов
+            "JMP": partial(jump, OpCode.JMP),
+            "JZ": partial(jump, OpCode.JZ),
+            "JNZ": partial(jump, OpCode.JNZ),
+            "JC": partial(jump, OpCode.JC),
+            "JNC": partial(jump, OpCode.JNC),
+            "JS": partial(jump, OpCode.JS),
+            "JNS": partial(jump, OpCode.JNS),
+            # Команды длинной арифметики
+            "ADDC": partial(arithmetic, OpCode.ADDC_REG, OpCode.ADDC_IMM),
+            "SUBC": partial(arithmetic, OpCode.SUBC_REG, OpCode.SUBC_IMM),
+            "CLC": lambda operands: create_instruction(OpCode.CLC),
+            "STC": lambda operands: create_instruction(OpCode.STC),
+        }
+
+    def _parse_assembly_line(self, parts: list[str]):
+        """Парсинг одной строки ассемблера, уже разбитой на токены"""
         if not parts:
             return None
 
         mnemonic = parts[0].upper()
-
-        # Системные команды
-        if mnemonic in ["NOP", "HALT"]:
-            return create_instruction(OpCode[mnemonic])
-
-        # Команды перемещения данных
-        elif mnemonic == "MOV":
-            return self._parse_mov(parts[1:])
-        elif mnemonic == "LOAD":
-            return self._parse_load(parts[1:])
-        elif mnemonic == "STORE":
-            return self._parse_store(parts[1:])
-
-        # Арифметические команды
-        elif mnemonic == "ADD":
-            return self._parse_arithmetic(OpCode.ADD_REG, OpCode.ADD_IMM, parts[1:])
-        elif mnemonic == "SUB":
-            return self._parse_arithmetic(OpCode.SUB_REG, OpCode.SUB_IMM, parts[1:])
-        elif mnemonic == "MUL":
-            return self._parse_arithmetic(OpCode.MUL_REG, OpCode.MUL_IMM, parts[1:])
-        elif mnemonic == "DIV":
-            return self._parse_arithmetic(OpCode.DIV_REG, OpCode.DIV_IMM, parts[1:])
-
-        # Логические команды
-        elif mnemonic == "AND":
-            return self._parse_arithmetic(OpCode.AND_REG, OpCode.AND_IMM, parts[1:])
-        elif mnemonic == "OR":
-            return self._parse_arithmetic(OpCode.OR_REG, OpCode.OR_IMM, parts[1:])
-        elif mnemonic == "XOR":
-            return self._parse_arithmetic(OpCode.XOR_REG, OpCode.XOR_IMM, parts[1:])
-        elif mnemonic == "NOT":
-            return self._parse_not(parts[1:])
-
-        # Команды сдвига
-        elif mnemonic == "SHL":
-            return self._parse_arithmetic(OpCode.SHL_REG, OpCode.SHL_IMM, parts[1:])
-        elif mnemonic == "SHR":
-            return self._parse_arithmetic(OpCode.SHR_REG, OpCode.SHR_IMM, parts[1:])
-        elif mnemonic == "SAR":
-            return self._parse_arithmetic(OpCode.SAR_REG, OpCode.SAR_IMM, parts[1:])
-
-        # Команды сравнения
-        elif mnemonic == "CMP":
-            return self._parse_arithmetic(OpCode.CMP_REG, OpCode.CMP_IMM, parts[1:])
-
-        # Команды переходов
-        elif mnemonic == "JMP":
-            return self._parse_jump(OpCode.JMP, parts[1:])
-        elif mnemonic == "JZ":
-            return self._parse_jump(OpCode.JZ, parts[1:])
-        elif mnemonic == "JNZ":
-            return self._parse_jump(OpCode.JNZ, parts[1:])
-        elif mnemonic == "JC":
-            return self._parse_jump(OpCode.JC, parts[1:])
-        elif mnemonic == "JNC":
-            return self._parse_jump(OpCode.JNC, parts[1:])
-        elif mnemonic == "JS":
-            return self._parse_jump(OpCode.JS, parts[1:])
-        elif mnemonic == "JNS":
-            return self._parse_jump(OpCode.JNS, parts[1:])
-
-        # Команды длинной арифметики
-        elif mnemonic == "ADDC":
-            return self._parse_arithmetic(OpCode.ADDC_REG, OpCode.ADDC_IMM, parts[1:])
-        elif mnemonic == "SUBC":
-            return self._parse_arithmetic(OpCode.SUBC_REG, OpCode.SUBC_IMM, parts[1:])
-        elif mnemonic == "CLC":
-            return create_instruction(OpCode.CLC)
-        elif mnemonic == "STC":
-            return create_instruction(OpCode.STC)
-
-        else:
+        parser = self._ops.get(mnemonic)
+        if parser is None:
             raise ValueError(f"Unknown mnemonic: {mnemonic}")
+        return parser(parts[1:])
 
     def _parse_register(self, reg_str: str) -> int:
         """Парсинг номера регистра из строки типа 'R0', 'R1', etc."""
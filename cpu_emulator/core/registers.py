@@ -1,3 +1,5 @@
+from array import array
+
 from loguru import logger
 
 from cpu_emulator.core.exceptions import RegisterException
@@ -5,7 +7,8 @@ from cpu_emulator.core.exceptions import RegisterException
 
 class Registers:
     def __init__(self, gpr_count: int = 8):
-        self.gpr = [0] * gpr_count
+        # 32-битные беззнаковые значения хранятся подряд, без отдельного int на регистр
+        self.gpr = array("I", [0]) * gpr_count
         self.gpr_count = gpr_count
 
         self.pc = 0  # счетчик команд
@@ -22,7 +25,7 @@ class Registers:
         self._operate_register(reg_num, value, "set")
 
     def reset(self) -> None:
-        self.gpr = [0] * self.gpr_count
+        self.gpr = array("I", [0]) * self.gpr_count
         self.pc = 0
         self.ir = 0
         self.sp = 0
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import threading
 import time
+from collections.abc import Sequence
 from tkinter import BOTH, END, LEFT, RIGHT, TOP, BOTTOM, X, Y
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
+from tkinter import font as tkfont
 
 from loguru import logger
 
-from cpu_emulator.core.cpu import CPU
+from cpu_emulator.core.cpu import CPU, CPUState
+from cpu_emulator.core.flags import FLAG_NAMES
 from cpu_emulator.core.program_loader import ProgramLoader
 from cpu_emulator.utils.demo_programs import (
     program_array_sum,
@@ -16,7 +18,41 @@ from cpu_emulator.utils.demo_programs import (
     program_array_sum_long,
     list_demo_names,
     get_demo_by_name,
+    assembled_demo,
 )
+from cpu_emulator.utils.memfmt import format_byte_rows, format_word_rows
+
+# Период перерисовки UI во время выполнения (~30 кадров/с), мс
+_UI_FRAME_MS = 33
+# Максимальное время выполнения шагов CPU за один тик Run, с
+_RUN_SLICE_S = 0.010
+# Регистры в панели: R0..R7 и R8 (SP)
+_REG_NAMES = tuple(f"R{i}" for i in range(9))
+# Подсветка изменившихся значений
+_FLASH_BG = "#FFF59D"
+_FLASH_MS = 300
+# Панель памяти: строк сверх видимых, выводимых выше и ниже окна прокрутки
+_MEM_OVERSCAN = 8
+# Строк за один щелчок колеса мыши
+_MEM_WHEEL_ROWS = 3
+
+
+def _readonly_text(master: tk.Misc, width: int) -> tk.Text:
+    """
+    Text-виджет панели памяти или исходника: только для чтения и переписывается программно,
+    поэтому стек отмены и синхронизация выделения — лишняя работа на каждый insert/delete
+    """
+    return tk.Text(
+        master,
+        height=30,
+        width=width,
+        font=("Courier", 10),
+        undo=False,
+        autoseparators=False,
+        maxundo=0,
+        blockcursor=False,
+        exportselection=False,
+    )
 
 
 class CPUEmulatorApp(tk.Tk):
@@ -27,18 +63,32 @@ class CPUEmulatorApp(tk.Tk):
 
         self.cpu = CPU()
         self.loader = ProgramLoader()
-        self.current_source_lines: list[str] = []
+        self.current_source_lines: Sequence[str] = []
 
         self._create_widgets()
-        self._running_thread: threading.Thread | None = None
-        self._stop_run_flag = threading.Event()
+        # Выполнение по таймеру Tk: пачка шагов за тик, без отдельного потока
+        self._running = False
+        self._run_job: str | None = None
+        self._run_batch = 1
+        self._run_delay_ms = 1
         # UI state helpers
-        self._prev_reg_values: list[int] = [0] * 9  # R0..R7 and R8(SP)
+        self._prev_reg_values: tuple[int, ...] = (0,) * len(_REG_NAMES)
         self._prev_flags: dict[str, int] = {}
-        # Removed default label background reliance; flashing restores per-widget original bg
         self._default_entry_bg: str | None = None
         self._was_halted: bool = False
-
+        # Flash highlight: changed widgets are batched per refresh, one restore timer
+        self._changed_this_tick: list[tk.Widget] = []
+        self._flashed: set[tk.Widget] = set()
+        self._changed_rows_this_tick: list[tuple[ttk.Treeview, str]] = []
+        self._flashed_rows: set[tuple[ttk.Treeview, str]] = set()
+        self._flash_job: str | None = None
+        self._default_label_bg = self.result_r0_hex_lbl.cget("background")
+        # Последние записанные в StringVar строки (по имени Tcl-переменной)
+        self._last_strings: dict[str, str] = {}
+        # Режим Run, в котором UI был отрисован последний раз
+        self._ui_drawn_running: bool | None = None
+
+        self._ui_job: str | None = None
         self._refresh_ui()
 
     # UI setup
@@ -106,8 +156,9 @@ class CPUEmulatorApp(tk.Tk):
 
         # Scenarios dropdown
         tk.Label(controls, text="Сценарии:").pack(side=LEFT, padx=(16, 4))
-        self.scenario_var = tk.StringVar(value=list_demo_names()[0])
-        self.scenario_menu = tk.OptionMenu(controls, self.scenario_var, *list_demo_names())
+        demo_names = list_demo_names()
+        self.scenario_var = tk.StringVar(value=demo_names[0])
+        self.scenario_menu = tk.OptionMenu(controls, self.scenario_var, *demo_names)
         self.scenario_menu.pack(side=LEFT, padx=2)
         self.load_scenario_btn = tk.Button(
             controls, text="Загрузить", command=self._on_load_scenario
@@ -127,26 +178,22 @@ class CPUEmulatorApp(tk.Tk):
         regs_frame = tk.LabelFrame(left_panel, text="Регистры")
         regs_frame.pack(side=TOP, fill=X, padx=4, pady=4)
 
-        self.reg_hex_vars: list[tk.StringVar] = []
-        self.reg_dec_vars: list[tk.StringVar] = []
-        self.reg_hex_labels: list[tk.Label] = []
-        self.reg_dec_labels: list[tk.Label] = []
+        # Регистры и флаги — одна таблица на панель: обновление строки одним item(...)
+        style = ttk.Style(self)
+        style.configure("Mono.Treeview", font="TkFixedFont")
+        self.regs_tree = ttk.Treeview(
+            regs_frame, columns=("hex", "dec"), show="tree", height=9, style="Mono.Treeview", selectmode="none"
+        )
+        self.regs_tree.column("#0", width=80, stretch=False)
+        self.regs_tree.column("hex", width=110, stretch=False)
+        self.regs_tree.column("dec", width=140, stretch=True)
+        self.regs_tree.tag_configure("changed", background=_FLASH_BG)
+        self.reg_iids: list[str] = []
         for i in range(9):  # R0..R7 and R8(SP)
-            var_hex = tk.StringVar(value="0x00000000")
-            var_dec = tk.StringVar(value="(d: 0)")
-            self.reg_hex_vars.append(var_hex)
-            self.reg_dec_vars.append(var_dec)
-            row = tk.Frame(regs_frame)
-            row.pack(fill=X)
             name = f"R{i}" if i < 8 else "R8 (SP)"
-            tk.Label(row, text=f"{name}:", width=9, anchor="w").pack(side=LEFT)
-            hex_lbl = tk.Label(row, textvariable=var_hex, width=12, anchor="w")
-            hex_lbl.pack(side=LEFT)
-            dec_lbl = tk.Label(row, textvariable=var_dec, width=16, anchor="w")
-            dec_lbl.pack(side=LEFT)
-            self.reg_hex_labels.append(hex_lbl)
-            self.reg_dec_labels.append(dec_lbl)
-            # no global bg caching needed
+            iid = self.regs_tree.insert("", END, text=name, values=("0x00000000", "(d: 0)"))
+            self.reg_iids.append(iid)
+        self.regs_tree.pack(fill=X)
 
         special_frame = tk.LabelFrame(left_panel, text="Специальные")
         special_frame.pack(side=TOP, fill=X, padx=4, pady=4)
@@ -165,17 +212,16 @@ class CPUEmulatorApp(tk.Tk):
 
         flags_frame = tk.LabelFrame(left_panel, text="Флаги")
         flags_frame.pack(side=TOP, fill=X, padx=4, pady=4)
-        self.flag_vars: dict[str, tk.StringVar] = {}
-        self.flag_labels: dict[str, tk.Label] = {}
-        for flag in ["Z", "S", "C", "O", "P"]:
-            var = tk.StringVar(value="0")
-            self.flag_vars[flag] = var
-            row = tk.Frame(flags_frame)
-            row.pack(fill=X)
-            tk.Label(row, text=f"{flag}:", width=9, anchor="w").pack(side=LEFT)
-            fl_lbl = tk.Label(row, textvariable=var, width=4, anchor="w")
-            fl_lbl.pack(side=LEFT)
-            self.flag_labels[flag] = fl_lbl
+        self.flags_tree = ttk.Treeview(
+            flags_frame, columns=("value",), show="tree", height=5, style="Mono.Treeview", selectmode="none"
+        )
+        self.flags_tree.column("#0", width=80, stretch=False)
+        self.flags_tree.column("value", width=60, stretch=True)
+        self.flags_tree.tag_configure("changed", background=_FLASH_BG)
+        self.flag_iids: dict[str, str] = {}
+        for flag in FLAG_NAMES:
+            self.flag_iids[flag] = self.flags_tree.insert("", END, text=flag, values=("0",))
+        self.flags_tree.pack(fill=X)
 
         # Result panel
         result_frame = tk.LabelFrame(left_panel, text="Результат")
@@ -215,7 +261,7 @@ class CPUEmulatorApp(tk.Tk):
         self.mem_base_var = tk.StringVar(value="0x0000")
         self.mem_base_entry = tk.Entry(mem_controls, width=12, textvariable=self.mem_base_var)
         self.mem_base_entry.pack(side=LEFT, padx=4)
-        tk.Button(mem_controls, text="Перейти", command=self._refresh_memory).pack(side=LEFT)
+        tk.Button(mem_controls, text="Перейти", command=self._on_mem_goto).pack(side=LEFT)
         # Rows count
         tk.Label(mem_controls, text="Строки:").pack(side=LEFT, padx=(12, 4))
         self.rows_var = tk.IntVar(value=64)
@@ -232,25 +278,51 @@ class CPUEmulatorApp(tk.Tk):
         # Memory view with scrollbar
         mem_view = tk.Frame(mem_side)
         mem_view.pack(side=TOP, fill=BOTH, expand=True, padx=4, pady=4)
-        self.mem_text = tk.Text(mem_view, height=30, width=80, font=("Courier", 10))
-        scroll = tk.Scrollbar(mem_view, orient=tk.VERTICAL, command=self.mem_text.yview)
-        self.mem_text.configure(state=tk.DISABLED, yscrollcommand=scroll.set)
+        self.mem_text = _readonly_text(mem_view, width=80)
+        # Прокруткой управляет панель: в Text выводятся только видимые строки и overscan,
+        # поэтому yscrollcommand виджета не подключается
+        self.mem_scroll = tk.Scrollbar(mem_view, orient=tk.VERTICAL, command=self._on_mem_yview)
+        self.mem_text.configure(state=tk.DISABLED)
         self.mem_text.pack(side=LEFT, fill=BOTH, expand=True)
-        scroll.pack(side=RIGHT, fill=Y)
+        self.mem_scroll.pack(side=RIGHT, fill=Y)
+        self.mem_text.bind("<Configure>", self._on_mem_configure)
+        self.mem_text.bind("<MouseWheel>", self._on_mem_wheel)
+        self.mem_text.bind("<Button-4>", self._on_mem_wheel)
+        self.mem_text.bind("<Button-5>", self._on_mem_wheel)
         # Tag for highlighting current PC line
         self.mem_text.tag_configure("pc_line", background="#FFF59D")
+        # Прокрутка: первая видимая строка окна, число видимых строк и высота строки в пикселях
+        self._mem_top = 0
+        self._mem_visible = int(self.mem_text.cget("height"))
+        self._mem_linespace = tkfont.Font(font=self.mem_text.cget("font")).metrics("linespace")
+        # Первая строка окна, выведенная в Text (видимые строки плюс overscan)
+        self._mem_render_top = 0
+        # Подпись выведенного блока: (вид, адрес первой строки, строки, начало чтения, байты)
+        self._last_mem_sig: tuple[str, int, int, int, bytes] | None = None
+        self._last_mem_pc_line = 0
+        # Строки, выведенные сейчас в панели памяти
+        self._mem_lines: list[str] = []
+        # Кэш окна для follow PC: ключ параметров окна, диапазон адресов [start, end) и шаг строки
+        self._follow_key: tuple[str, object, str] | None = None
+        self._follow_window = (0, 0, 4)
+        # Разобранные значения полей ввода: (сырое значение, число, корректно ли)
+        self._base_cache: tuple[str | None, int, bool] = (None, 0, False)
+        self._rows_cache: tuple[object, int, bool] = (None, 64, False)
 
         # Source view
         src_frame = tk.LabelFrame(src_side, text="Программа (ASM)")
         src_frame.pack(side=TOP, fill=BOTH, expand=True, padx=4, pady=4)
         src_container = tk.Frame(src_frame)
         src_container.pack(fill=BOTH, expand=True)
-        self.src_text = tk.Text(src_container, height=30, width=50, font=("Courier", 10))
+        self.src_text = _readonly_text(src_container, width=50)
         src_scroll = tk.Scrollbar(src_container, orient=tk.VERTICAL, command=self.src_text.yview)
         self.src_text.configure(state=tk.DISABLED, yscrollcommand=src_scroll.set)
         self.src_text.pack(side=LEFT, fill=BOTH, expand=True)
         src_scroll.pack(side=RIGHT, fill=Y)
         self.src_text.tag_configure("src_pc_line", background="#E1F5FE")
+        self._src_line_count = 0
+        self._last_src_pc = -1
+        self._src_view_lines: Sequence[str] | None = None
 
         # Status bar
         self.status_var = tk.StringVar(value="Готово")
@@ -267,26 +339,45 @@ class CPUEmulatorApp(tk.Tk):
         except Exception:
             pass
 
-    def _flash_widgets(self, widgets: list[tk.Widget], color: str = "#FFF59D", duration_ms: int = 300) -> None:
-        # Capture original backgrounds per widget to restore accurately
-        original_bg: dict[tk.Widget, str] = {}
-        for w in widgets:
+    def _flash_widgets(self, widgets: list[tk.Widget]) -> None:
+        # Подсветка копится за тик и снимается одним общим таймером
+        self._changed_this_tick.extend(widgets)
+
+    def _flash_row(self, tree: ttk.Treeview, iid: str) -> None:
+        self._changed_rows_this_tick.append((tree, iid))
+
+    def _apply_flashes(self) -> None:
+        if not self._changed_this_tick and not self._changed_rows_this_tick:
+            return
+        for tree, iid in self._changed_rows_this_tick:
+            if (tree, iid) not in self._flashed_rows:
+                tree.item(iid, tags=("changed",))
+                self._flashed_rows.add((tree, iid))
+        self._changed_rows_this_tick.clear()
+        for w in self._changed_this_tick:
+            if w in self._flashed:
+                continue
             try:
-                original_bg[w] = w.cget("background")
+                w.configure(background=_FLASH_BG)
+                self._flashed.add(w)
             except Exception:
                 pass
+        self._changed_this_tick.clear()
+        # Уже запланированный сброс не откладывается: иначе при Run подсветка не гаснет
+        if self._flash_job is None:
+            self._flash_job = self.after(_FLASH_MS, self._clear_all_flashes)
+
+    def _clear_all_flashes(self) -> None:
+        self._flash_job = None
+        for w in self._flashed:
             try:
-                w.configure(background=color)
+                w.configure(background=self._default_label_bg)
             except Exception:
                 pass
-        def restore():
-            for w in widgets:
-                try:
-                    if w in original_bg:
-                        w.configure(background=original_bg[w])
-                except Exception:
-                    pass
-        self.after(duration_ms, restore)
+        self._flashed.clear()
+        for tree, iid in self._flashed_rows:
+            tree.item(iid, tags=())
+        self._flashed_rows.clear()
 
     # Actions
     def _on_load(self) -> None:
@@ -311,7 +402,7 @@ class CPUEmulatorApp(tk.Tk):
             messagebox.showerror("Load Error", str(e))
 
     def _on_reset(self) -> None:
-        self._stop_run_flag.set()
+        self._stop_running()
         self.cpu.reset()
         self._refresh_ui()
         self.status_var.set("CPU reset")
@@ -325,9 +416,8 @@ class CPUEmulatorApp(tk.Tk):
             messagebox.showerror("Step Error", str(e))
 
     def _on_run(self) -> None:
-        if self._running_thread and self._running_thread.is_alive():
+        if self._running:
             return
-        self._stop_run_flag.clear()
         try:
             hz = int(self.speed_var.get())
             if hz < 1:
@@ -338,31 +428,55 @@ class CPUEmulatorApp(tk.Tk):
             return
         self._set_entry_valid(self.speed_entry, True)
 
-        def runner():
-            logger.info("Run started")
-            delay = 1.0 / hz
-            while not self._stop_run_flag.is_set() and not self.cpu.halted:
-                try:
-                    self.cpu.step()
-                except Exception as e:
-                    logger.exception("Run step failed")
-                    self.after(0, lambda: messagebox.showerror("Run Error", str(e)))
-                    break
-                # Update UI in main thread
-                self.after(0, self._refresh_ui)
-                time.sleep(delay)
-            logger.info("Run stopped")
-
-        self._running_thread = threading.Thread(target=runner, daemon=True)
-        self._running_thread.start()
+        # Около 30 тиков в секунду: на высоких частотах за тик выполняется пачка шагов
+        self._run_batch = max(1, hz // 30)
+        self._run_delay_ms = max(1, int(1000 / hz * self._run_batch))
+        self._running = True
+        self._schedule_ui_tick()
+        logger.info("Run started")
         self.status_var.set("Выполнение…")
         try:
             self._update_controls_state(self.cpu.get_state())
         except Exception:
             pass
+        self._run_tick()
+
+    def _run_tick(self) -> None:
+        self._run_job = None
+        if not self._running:
+            return
+        cpu = self.cpu
+        step = cpu.step
+        # Шаги выполняются в главном потоке, поэтому тик ограничен по времени:
+        # при недостижимой частоте пачка обрывается и Tk успевает обработать события
+        deadline = time.perf_counter() + _RUN_SLICE_S
+        try:
+            for i in range(self._run_batch):
+                if cpu.halted:
+                    break
+                step()
+                if not i & 63 and time.perf_counter() > deadline:
+                    break
+        except Exception as e:
+            self._stop_running()
+            logger.exception("Run step failed")
+            messagebox.showerror("Run Error", str(e))
+            return
+        if cpu.halted:
+            self._stop_running()
+            return
+        self._run_job = self.after(self._run_delay_ms, self._run_tick)
+
+    def _stop_running(self) -> None:
+        if self._run_job is not None:
+            self.after_cancel(self._run_job)
+            self._run_job = None
+        if self._running:
+            self._running = False
+            logger.info("Run stopped")
 
     def _on_pause(self) -> None:
-        self._stop_run_flag.set()
+        self._stop_running()
         self.status_var.set("Пауза")
         try:
             self._update_controls_state(self.cpu.get_state())
@@ -370,73 +484,71 @@ class CPUEmulatorApp(tk.Tk):
             pass
 
     # UI refreshers
-    def _refresh_ui(self) -> None:
+    def _sv(self, var: tk.StringVar, value: str) -> None:
+        """Записывает строку в StringVar, только если она изменилась (без лишних Tcl-трейсов)"""
+        name = str(var)
+        if self._last_strings.get(name) != value:
+            var.set(value)
+            self._last_strings[name] = value
+
+    def _ui_tick(self) -> None:
+        """Перерисовка с фиксированной частотой, только если состояние CPU изменилось"""
+        self._ui_job = None
+        if self._refresh_ui(force=False):
+            # Все изменения кадра уже внесены: одна отрисовка вместо промежуточных
+            self.update_idletasks()
+        # Вне Run состояние меняют только обработчики, которые сами вызывают _refresh_ui:
+        # таймер останавливается, и остановленный CPU не нагружает GUI
+        if self._running:
+            self._schedule_ui_tick()
+
+    def _schedule_ui_tick(self) -> None:
+        if self._ui_job is None:
+            self._ui_job = self.after(_UI_FRAME_MS, self._ui_tick)
+
+    def _refresh_ui(self, force: bool = True) -> bool:
+        """Обновляет панели по состоянию CPU; возвращает True, если что-то перерисовывалось"""
+        # Без force перерисовка только при изменении CPU (cpu.dirty) или режима Run
+        if not force and not self.cpu.dirty and self._running == self._ui_drawn_running:
+            return False
+        self.cpu.dirty = False
+        self._ui_drawn_running = self._running
         state = self.cpu.get_state()
-        # Registers
-        for i in range(8):
-            value = state["registers"][f"R{i}"] & 0xFFFFFFFF
-            self.reg_hex_vars[i].set(f"0x{value:08X}")
-            self.reg_dec_vars[i].set(f"(d: {value})")
-            if value != self._prev_reg_values[i]:
-                self._flash_widgets([self.reg_hex_labels[i], self.reg_dec_labels[i]])
-                self._prev_reg_values[i] = value
-        sp_val = state["registers"]["R8"] & 0xFFFFFFFF
-        self.reg_hex_vars[8].set(f"0x{sp_val:08X}")
-        self.reg_dec_vars[8].set(f"(d: {sp_val})")
-        if sp_val != self._prev_reg_values[8]:
-            self._flash_widgets([self.reg_hex_labels[8], self.reg_dec_labels[8]])
-            self._prev_reg_values[8] = sp_val
+        # Registers: one tuple compare, per-register walk only on mismatch
+        reg_values = tuple(value & 0xFFFFFFFF for value in state.registers)
+        if reg_values != self._prev_reg_values:
+            for i, (value, prev) in enumerate(zip(reg_values, self._prev_reg_values, strict=True)):
+                if value != prev:
+                    self.regs_tree.item(self.reg_iids[i], values=(f"0x{value:08X}", f"(d: {value})"))
+                    self._flash_row(self.regs_tree, self.reg_iids[i])
+            self._prev_reg_values = reg_values
 
         # Special
-        self.pc_var.set(f"0x{state['pc']:05X}")
-        # IR may not be present initially
-        ir_value = getattr(self.cpu.registers, "ir", 0) & 0xFFFFFFFF
-        self.ir_var.set(f"0x{ir_value:08X}")
-        self.cycle_var.set(str(state["cycle_count"]))
+        self._sv(self.pc_var, f"0x{state.pc:05X}")
+        # IR задаётся в Registers.__init__/reset, getattr с запасным значением не нужен
+        ir_value = self.cpu.registers.ir & 0xFFFFFFFF
+        self._sv(self.ir_var, f"0x{ir_value:08X}")
+        self._sv(self.cycle_var, str(state.cycle_count))
 
         # Flags
-        for flag, var in self.flag_vars.items():
-            val = int(state["flags"].get(flag, 0))
-            var.set(str(val))
+        for flag, raw in zip(FLAG_NAMES, state.flags, strict=True):
+            val = int(raw)
             if self._prev_flags.get(flag, -1) != val:
-                self._flash_widgets([self.flag_labels[flag]])
+                iid = self.flag_iids[flag]
+                self.flags_tree.item(iid, values=(str(val),))
+                self._flash_row(self.flags_tree, iid)
                 self._prev_flags[flag] = val
 
         # Result values (always update; flash on halt transition)
-        r0 = state["registers"]["R0"] & 0xFFFFFFFF
-        r1 = state["registers"]["R1"] & 0xFFFFFFFF
+        r0 = state.registers[0] & 0xFFFFFFFF
+        r1 = state.registers[1] & 0xFFFFFFFF
         r64 = ((r1 << 32) | r0) & 0xFFFFFFFFFFFFFFFF
-        self.result_r0_hex_var.set(f"0x{r0:08X}")
-        self.result_r0_dec_var.set(f"(d: {r0})")
-        self.result_64_hex_var.set(f"0x{r64:016X}")
+        self._sv(self.result_r0_hex_var, f"0x{r0:08X}")
+        self._sv(self.result_r0_dec_var, f"(d: {r0})")
+        self._sv(self.result_64_hex_var, f"0x{r64:016X}")
 
         # Adjust memory base if follow PC is enabled
-        try:
-            pc = int(self.cpu.registers.pc)
-            rows = max(1, int(self.rows_var.get()))
-            base = self._parse_base_address()
-            mode = self.mem_view_mode.get()
-            if mode == "Bytes":
-                aligned_base = base - (base % 16) if base % 16 != 0 else base
-                window_start = aligned_base
-                window_end = aligned_base + rows * 16
-                step = 16
-            else:
-                aligned_base = base - (base % 4) if base % 4 != 0 else base
-                window_start = aligned_base
-                window_end = aligned_base + rows * 4
-                step = 4
-            if self.follow_pc_var.get():
-                if not (window_start <= pc < window_end):
-                    # Center PC in the window when possible
-                    centered_base = pc - (rows // 2) * step
-                    if centered_base < 0:
-                        centered_base = 0
-                    # Align to view granularity
-                    centered_base = centered_base - (centered_base % step)
-                    self.mem_base_var.set(f"0x{centered_base:04X}")
-        except Exception:
-            pass
+        self._follow_pc()
 
         # Memory
         self._refresh_memory()
@@ -449,37 +561,39 @@ class CPUEmulatorApp(tk.Tk):
             pass
         # Flash results on transition to halted
         try:
-            if bool(state.get("halted", False)) and not self._was_halted:
+            if state.halted and not self._was_halted:
                 self._flash_widgets([self.result_r0_hex_lbl, self.result_r0_dec_lbl, self.result_64_hex_lbl])
                 self.status_var.set("Остановлено. Результат обновлён.")
                 self._was_halted = True
-            elif not bool(state.get("halted", False)):
+            elif not state.halted:
                 self._was_halted = False
         except Exception:
             pass
+        self._apply_flashes()
+        return True
 
-    def _update_controls_state(self, state: dict) -> None:
-        is_running_thread = self._running_thread is not None and self._running_thread.is_alive()
-        is_halted = bool(state.get("halted", False))
+    def _update_controls_state(self, state: CPUState) -> None:
+        is_running = self._running
+        is_halted = state.halted
 
         # Load and scenarios are disabled while running
         set_disabled_while_running = [self.load_btn, self.scenario_menu, self.load_scenario_btn]
         for btn in set_disabled_while_running:
             try:
-                btn.configure(state=tk.DISABLED if is_running_thread else tk.NORMAL)
+                btn.configure(state=tk.DISABLED if is_running else tk.NORMAL)
             except Exception:
                 pass
 
         # Run/Step disabled when running or halted
         try:
-            self.run_btn.configure(state=tk.DISABLED if (is_running_thread or is_halted) else tk.NORMAL)
-            self.step_btn.configure(state=tk.DISABLED if (is_running_thread or is_halted) else tk.NORMAL)
+            self.run_btn.configure(state=tk.DISABLED if (is_running or is_halted) else tk.NORMAL)
+            self.step_btn.configure(state=tk.DISABLED if (is_running or is_halted) else tk.NORMAL)
         except Exception:
             pass
 
         # Pause enabled only when running
         try:
-            self.pause_btn.configure(state=tk.NORMAL if is_running_thread else tk.DISABLED)
+            self.pause_btn.configure(state=tk.NORMAL if is_running else tk.DISABLED)
         except Exception:
             pass
 
@@ -489,27 +603,68 @@ class CPUEmulatorApp(tk.Tk):
         except Exception:
             pass
 
-    def _parse_base_address(self) -> int:
-        text = self.mem_base_var.get().strip()
+    def _follow_pc(self) -> None:
+        if not self.follow_pc_var.get():
+            return
         try:
-            if text.lower().startswith("0x"):
-                return int(text, 16)
-            return int(text)
+            pc = int(self.cpu.registers.pc)
+            # Окно пересчитывается только при смене его параметров или выходе PC за его пределы
+            key = (
+                self.mem_base_var.get(),
+                self.getvar(str(self.rows_var)),
+                self.mem_view_mode.get(),
+            )
+            if key == self._follow_key:
+                window_start, window_end, step = self._follow_window
+            else:
+                rows = self._parse_rows_input()[0]
+                base = self._parse_base_address()
+                step = 16 if key[2] == "Bytes" else 4
+                window_start = base - (base % step)
+                window_end = window_start + rows * step
+                self._follow_key = key
+                self._follow_window = (window_start, window_end, step)
+            if window_start <= pc < window_end:
+                # PC в окне, но может быть за прокруткой: сдвигаем видимые строки к нему
+                pc_row = (pc - window_start) // step
+                if not self._mem_top <= pc_row < self._mem_top + self._mem_visible:
+                    self._mem_top = max(0, pc_row - self._mem_visible // 2)
+                return
+            rows = self._parse_rows_input()[0]
+            # Center PC in the window when possible
+            centered_base = pc - (rows // 2) * step
+            if centered_base < 0:
+                centered_base = 0
+            # Align to view granularity
+            centered_base = centered_base - (centered_base % step)
+            self.mem_base_var.set(f"0x{centered_base:04X}")
+            self._mem_top = max(0, (pc - centered_base) // step - self._mem_visible // 2)
         except Exception:
-            return 0
+            pass
 
-    def _refresh_memory(self) -> None:
-        text = self.mem_base_var.get().strip()
-        base_ok = True
+    def _parse_base_input(self) -> tuple[int, bool]:
+        """Базовый адрес из поля ввода и признак корректности (разбор кэшируется по сырой строке)"""
+        raw = self.mem_base_var.get()
+        if raw == self._base_cache[0]:
+            return self._base_cache[1], self._base_cache[2]
+        text = raw.strip()
         try:
             if text.lower().startswith("0x"):
                 base = int(text, 16)
             else:
                 base = int(text)
+            base_ok = True
         except Exception:
             base = 0
             base_ok = False
-        self._set_entry_valid(self.mem_base_entry, base_ok)
+        self._base_cache = (raw, base, base_ok)
+        return base, base_ok
+
+    def _parse_rows_input(self) -> tuple[int, bool]:
+        """Число строк из поля ввода и признак корректности (разбор кэшируется по сырому значению)"""
+        raw = self.getvar(str(self.rows_var))
+        if raw == self._rows_cache[0]:
+            return self._rows_cache[1], self._rows_cache[2]
         try:
             rows_val = int(self.rows_var.get())
             rows = max(1, rows_val)
@@ -517,97 +672,172 @@ class CPUEmulatorApp(tk.Tk):
         except Exception:
             rows = 64
             rows_ok = False
+        self._rows_cache = (raw, rows, rows_ok)
+        return rows, rows_ok
+
+    def _parse_base_address(self) -> int:
+        return self._parse_base_input()[0]
+
+    def _refresh_memory(self) -> None:
+        base, base_ok = self._parse_base_input()
+        self._set_entry_valid(self.mem_base_entry, base_ok)
+        rows, rows_ok = self._parse_rows_input()
         self._set_entry_valid(self.rows_entry, rows_ok)
 
         mode = self.mem_view_mode.get()
-        self.mem_text.configure(state=tk.NORMAL)
-        self.mem_text.delete("1.0", END)
-        self.mem_text.tag_remove("pc_line", "1.0", END)
+        step = 16 if mode == "Bytes" else 4
+        aligned_base = base - (base % step)
+
+        # Окно из rows строк; выводится только блок вокруг видимых строк
+        visible = min(self._mem_visible, rows)
+        top = min(max(0, self._mem_top), rows - visible)
+        self._mem_top = top
+        render_top = self._mem_render_top
+        count = min(visible + 2 * _MEM_OVERSCAN, rows - render_top)
+        if top < render_top or top + visible > render_top + count:
+            # Видимые строки вышли за выведенный блок: новый блок с overscan с обеих сторон
+            render_top = max(0, top - _MEM_OVERSCAN)
+            count = min(visible + 2 * _MEM_OVERSCAN, rows - render_top)
+            self._mem_render_top = render_top
+        render_base = aligned_base + render_top * step
+        # Одно чтение выводимого блока вместо построчных read_byte/read_word
+        start, buf = self._read_window(render_base, count * step)
+
+        # Строка блока с PC (1-based), 0 — PC вне блока
+        pc_line_no = 0
+        try:
+            pc = int(self.cpu.registers.pc)
+            if render_base <= pc < render_base + count * step and (mode == "Bytes" or pc % 4 == 0):
+                pc_line_no = ((pc - render_base) // step) + 1
+        except Exception:
+            pass
+
+        # Блок и его содержимое не изменились: переносим только подсветку PC и прокрутку
+        sig = (mode, render_base, count, start, buf)
+        if sig == self._last_mem_sig:
+            if pc_line_no != self._last_mem_pc_line:
+                self._set_mem_pc_line(pc_line_no)
+            self._place_mem_view(top - render_top, count, top, visible, rows)
+            return
+        self._last_mem_sig = sig
 
         if mode == "Bytes":
             # Hex dump of bytes with ASCII, 16 bytes per row
-            aligned_base = base - (base % 16) if base % 16 != 0 else base
-            lines: list[str] = []
-            for row in range(rows):
-                row_addr = (aligned_base + row * 16) & 0xFFFFFFFF
-                hex_bytes: list[str] = []
-                ascii_chars: list[str] = []
-                for i in range(16):
-                    addr = row_addr + i
-                    try:
-                        b = self.cpu.memory.read_byte(addr)
-                        hex_bytes.append(f"{b:02X}")
-                        ascii_chars.append(chr(b) if 32 <= b < 127 else ".")
-                    except Exception:
-                        hex_bytes.append("??")
-                        ascii_chars.append(".")
-                hex_part = " ".join(hex_bytes)
-                ascii_part = "".join(ascii_chars)
-                lines.append(f"0x{row_addr:05X}: {hex_part:<47}  {ascii_part}")
-
-            self.mem_text.insert("1.0", "\n".join(lines))
-
-            # Highlight current PC row if within window
-            try:
-                pc = int(self.cpu.registers.pc)
-                if aligned_base <= pc < aligned_base + rows * 16:
-                    line_no = ((pc - aligned_base) // 16) + 1
-                    self.mem_text.tag_add("pc_line", f"{line_no}.0", f"{line_no}.end")
-            except Exception:
-                pass
-
+            lines = format_byte_rows(buf, start, render_base, count)
         else:
             # Words view: one 32-bit word per row (hex only)
-            aligned_base = base - (base % 4) if base % 4 != 0 else base
-            lines: list[str] = []
-            for row in range(rows):
-                addr = (aligned_base + row * 4) & 0xFFFFFFFF
-                try:
-                    word = self.cpu.memory.read_word(addr)
-                    lines.append(f"0x{addr:05X}: 0x{word:08X}")
-                except Exception as e:
-                    lines.append(f"0x{addr:05X}: <err>")
+            lines = format_word_rows(buf, start, render_base, count)
 
+        old_lines = self._mem_lines
+        self.mem_text.configure(state=tk.NORMAL)
+        if len(old_lines) == len(lines):
+            # Обычно от шага к шагу меняется одна-две строки: заменяем только их
+            for line_no, (old, new) in enumerate(zip(old_lines, lines, strict=True), 1):
+                if old != new:
+                    self.mem_text.replace(f"{line_no}.0", f"{line_no}.end", new)
+        else:
+            self.mem_text.delete("1.0", END)
             self.mem_text.insert("1.0", "\n".join(lines))
+            self._last_mem_pc_line = 0
+        self.mem_text.configure(state=tk.DISABLED)
+        self._mem_lines = lines
+        self._set_mem_pc_line(pc_line_no)
+        self._place_mem_view(top - render_top, count, top, visible, rows)
+
+    def _place_mem_view(self, offset: int, count: int, top: int, visible: int, rows: int) -> None:
+        """Прокручивает Text к первой видимой строке блока и ставит ползунок по положению в окне"""
+        self.mem_text.yview_moveto(offset / count)
+        self.mem_scroll.set(top / rows, (top + visible) / rows)
+
+    def _scroll_mem_to(self, top: int) -> None:
+        # Границы top проверяет _refresh_memory
+        if top != self._mem_top:
+            self._mem_top = top
+            self._refresh_memory()
 
-            # Highlight the PC's word line if within window
-            try:
-                pc = int(self.cpu.registers.pc)
-                if aligned_base <= pc < aligned_base + rows * 4 and pc % 4 == 0:
-                    line_no = ((pc - aligned_base) // 4) + 1
-                    self.mem_text.tag_add("pc_line", f"{line_no}.0", f"{line_no}.end")
-            except Exception:
-                pass
+    def _on_mem_yview(self, *args: str) -> None:
+        """Команда полосы прокрутки: moveto <доля> или scroll <n> units|pages"""
+        rows = self._parse_rows_input()[0]
+        if args[0] == "moveto":
+            self._scroll_mem_to(int(float(args[1]) * rows))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self._mem_visible
+            self._scroll_mem_to(self._mem_top + amount)
+
+    def _on_mem_wheel(self, event: tk.Event) -> str:
+        # Button-4/5 — колесо в X11, MouseWheel — Windows и macOS
+        if event.num == 4 or event.delta > 0:
+            direction = -1
+        else:
+            direction = 1
+        self._scroll_mem_to(self._mem_top + direction * _MEM_WHEEL_ROWS)
+        return "break"
+
+    def _on_mem_configure(self, event: tk.Event) -> None:
+        visible = max(1, event.height // self._mem_linespace)
+        if visible != self._mem_visible:
+            self._mem_visible = visible
+            self._refresh_memory()
 
-        self.mem_text.configure(state=tk.DISABLED)
+    def _on_mem_goto(self) -> None:
+        # Новый базовый адрес показывается с первой строки окна
+        self._mem_top = 0
+        self._refresh_memory()
+
+    def _set_mem_pc_line(self, line_no: int) -> None:
+        # Теги можно менять и в состоянии DISABLED
+        if self._last_mem_pc_line:
+            self.mem_text.tag_remove("pc_line", "1.0", END)
+        if line_no:
+            self.mem_text.tag_add("pc_line", f"{line_no}.0", f"{line_no}.end")
+        self._last_mem_pc_line = line_no
+
+    def _read_window(self, base: int, length: int) -> tuple[int, bytes]:
+        """Читает доступную часть окна [base, base+length); возвращает (начало, байты)"""
+        memory = self.cpu.memory
+        start = max(0, base)
+        end = min(base + length, memory.size)
+        if start >= end:
+            return start, b""
+        return start, memory.read_range(start, end - start)
 
     def _populate_source_view(self) -> None:
         lines = self.current_source_lines
+        # Тот же объект исходника уже выведен: повторная перерисовка не нужна
+        if lines is self._src_view_lines:
+            return
+        self._src_view_lines = lines
         self.src_text.configure(state=tk.NORMAL)
         self.src_text.delete("1.0", END)
-        formatted: list[str] = []
-        for i, line in enumerate(lines):
-            addr = i * 4
-            formatted.append(f"0x{addr:05X}: {line}")
-        self.src_text.insert("1.0", "\n".join(formatted))
+        # Адреса команд идут с шагом 4 байта
+        body = "\n".join(map("0x{:05X}: {}".format, range(0, len(lines) * 4, 4), lines))
+        self.src_text.insert("1.0", body)
         self.src_text.configure(state=tk.DISABLED)
+        self._src_line_count = len(lines)
+        self._last_src_pc = -1
 
     def _refresh_source_highlight(self) -> None:
-        self.src_text.configure(state=tk.NORMAL)
-        self.src_text.tag_remove("src_pc_line", "1.0", END)
         try:
             pc = int(self.cpu.registers.pc)
+        except Exception:
+            return
+        # Перетегирование только при смене PC; теги не требуют state=NORMAL
+        if pc == self._last_src_pc:
+            return
+        self._last_src_pc = pc
+        self.src_text.tag_remove("src_pc_line", "1.0", END)
+        try:
             line_index = (pc // 4) + 1
-            total_lines = int(self.src_text.index('end-1c').split('.')[0])
-            if 1 <= line_index <= total_lines:
+            if 1 <= line_index <= self._src_line_count:
                 start_idx = f"{line_index}.0"
                 end_idx = f"{line_index}.end"
                 self.src_text.tag_add("src_pc_line", start_idx, end_idx)
-                # Optional: scroll into view
+                # Прокрутка только при смене строки PC (выше ранний выход)
                 self.src_text.see(start_idx)
         except Exception:
             pass
-        self.src_text.configure(state=tk.DISABLED)
 
     def _goto_pc(self) -> None:
         try:
@@ -621,6 +851,7 @@ class CPUEmulatorApp(tk.Tk):
                 base = 0
             base = base - (base % step)
             self.mem_base_var.set(f"0x{base:04X}")
+            self._mem_top = max(0, (pc - base) // step - self._mem_visible // 2)
             self._refresh_memory()
         except Exception:
             pass
@@ -630,7 +861,7 @@ class CPUEmulatorApp(tk.Tk):
         """Load and run array sum scenario."""
         program_assembly = program_array_sum()
         try:
-            machine_code = self.loader.assemble_simple(program_assembly)
+            machine_code = assembled_demo("Сумма массива")
             self.cpu.reset()
             self.cpu.load_program(machine_code)
             self.current_source_lines = program_assembly
@@ -645,7 +876,7 @@ class CPUEmulatorApp(tk.Tk):
         """Load and run convolution scenario."""
         program_assembly = program_convolution()
         try:
-            machine_code = self.loader.assemble_simple(program_assembly)
+            machine_code = assembled_demo("Свертка массивов")
             self.cpu.reset()
             self.cpu.load_program(machine_code)
             self.current_source_lines = program_assembly
@@ -660,7 +891,7 @@ class CPUEmulatorApp(tk.Tk):
         """Load and run 64-bit array sum scenario (R1:R0)."""
         program_assembly = program_array_sum_long()
         try:
-            machine_code = self.loader.assemble_simple(program_assembly)
+            machine_code = assembled_demo("Сумма массива (64-бит)")
             self.cpu.reset()
             self.cpu.load_program(machine_code)
             self.current_source_lines = program_assembly
@@ -675,7 +906,7 @@ class CPUEmulatorApp(tk.Tk):
         try:
             name = self.scenario_var.get()
             program_assembly = get_demo_by_name(name)
-            machine_code = self.loader.assemble_simple(program_assembly)
+            machine_code = assembled_demo(name)
             self.cpu.reset()
             self.cpu.load_program(machine_code)
             self.current_source_lines = program_assembly
@@ -1,25 +1,29 @@
 from __future__ import annotations
 
+import functools
+import itertools
+from collections.abc import Callable, Iterable
 
-def program_array_sum() -> list[str]:
+from cpu_emulator.core.program_loader import ProgramLoader
+
+
+def _emit_init(base: int, values: Iterable[int]) -> list[str]:
+    """Запись массива values по адресу base (R1 — указатель, R2 — значение)"""
+    body = list(
+        itertools.chain.from_iterable(
+            (f"MOV R2, #{v}", "STORE [R1], R2", "ADD R1, #4") for v in values
+        )
+    )
+    # После последнего элемента указатель не сдвигается
+    return [f"MOV R1, #{base}", *body[:-1]]
+
+
+@functools.cache
+def program_array_sum() -> tuple[str, ...]:
     """Array sum demo program assembly."""
-    return [
+    return (
         # Initialize array [10,20,30,40,50] at 2000..2016
-        "MOV R1, #2000",
-        "MOV R2, #10",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #20",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #30",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #40",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #50",
-        "STORE [R1], R2",
+        *_emit_init(2000, (10, 20, 30, 40, 50)),
         # Sum loop
         "MOV R0, #0",
         "MOV R1, #2000",
@@ -31,44 +35,17 @@ def program_array_sum() -> list[str]:
         "CMP R3, #0",
         "JNZ 72",
         "HALT",
-    ]
+    )
 
 
-def program_convolution() -> list[str]:
+@functools.cache
+def program_convolution() -> tuple[str, ...]:
     """Convolution of two arrays demo program assembly."""
-    return [
+    return (
         # Initialize A[1,2,3,4,5] at 3000..3016
-        "MOV R1, #3000",
-        "MOV R2, #1",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #2",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #3",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #4",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #5",
-        "STORE [R1], R2",
+        *_emit_init(3000, (1, 2, 3, 4, 5)),
         # Initialize B[5,4,3,2,1] at 4000..4016
-        "MOV R1, #4000",
-        "MOV R2, #5",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #4",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #3",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #2",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #1",
-        "STORE [R1], R2",
+        *_emit_init(4000, (5, 4, 3, 2, 1)),
         # Convolution loop
         "MOV R0, #0",
         "MOV R1, #3000",
@@ -84,12 +61,13 @@ def program_convolution() -> list[str]:
         "CMP R7, #0",
         "JNZ 136",
         "HALT",
-    ]
+    )
 
 
-def program_long_arithmetic() -> list[str]:
+@functools.cache
+def program_long_arithmetic() -> tuple[str, ...]:
     """64-bit addition demo using 32-bit registers and carry."""
-    return [
+    return (
         # Initialize A = 0x00000001FFFFFFFF (low: 0xFFFFFFFF, high: 0x00000001)
         # Initialize B = 0x0000000000000001 (low: 0x00000001, high: 0x00000000)
         "MOV R0, #-1",     # A low
@@ -101,28 +79,15 @@ def program_long_arithmetic() -> list[str]:
         "ADD R0, R2",
         "ADDC R1, R3",
         "HALT",
-    ]
+    )
 
 
-def program_array_sum_long() -> list[str]:
+@functools.cache
+def program_array_sum_long() -> tuple[str, ...]:
     """Array sum with 64-bit accumulation in R1:R0 using carry."""
-    return [
+    return (
         # Initialize array [10,20,30,40,50] at 2000..2016
-        "MOV R1, #2000",
-        "MOV R2, #10",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #20",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #30",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #40",
-        "STORE [R1], R2",
-        "ADD R1, #4",
-        "MOV R2, #50",
-        "STORE [R1], R2",
+        *_emit_init(2000, (10, 20, 30, 40, 50)),
         # 64-bit sum: R1:R0 accumulator, R4 pointer, R3 count, R6 zero for ADDC
         "MOV R0, #0",
         "MOV R1, #0",
@@ -139,27 +104,43 @@ def program_array_sum_long() -> list[str]:
         "CMP R3, #0",
         "JNZ 80",
         "HALT",
-    ]
+    )
+
+
+# Встроенные демо в порядке показа в меню
+_DEMOS: dict[str, Callable[[], tuple[str, ...]]] = {
+    "Сумма массива": program_array_sum,
+    "Свертка массивов": program_convolution,
+    "Длинная арифметика": program_long_arithmetic,
+    "Сумма массива (64-бит)": program_array_sum_long,
+}
+# Старые написания имён, принимаемые для совместимости
+_DEMO_ALIASES = {
+    "Длинная ариритметика": "Длинная арифметика",
+}
+
+
+def list_demo_names() -> tuple[str, ...]:
+    return tuple(_DEMOS)
 
 
-def list_demo_names() -> list[str]:
-    return [
-        "Сумма массива",
-        "Свертка массивов",
-        "Длинная арифметика",
-        "Сумма массива (64-бит)",
-    ]
+def get_demo_by_name(name: str) -> tuple[str, ...]:
+    try:
+        program = _DEMOS[_DEMO_ALIASES.get(name, name)]
+    except KeyError:
+        raise KeyError(f"Unknown demo: {name}") from None
+    return program()
 
 
-def get_demo_by_name(name: str) -> list[str]:
-    if name == "Сумма массива":
-        return program_array_sum()
-    if name == "Свертка массивов":
-        return program_convolution()
-    if name == "Длинная ариритметика" or name == "Длинная арифметика":
-        return program_long_arithmetic()
-    if name == "Сумма массива (64-бит)":
-        return program_array_sum_long()
-    raise KeyError(f"Unknown demo: {name}")
+@functools.cache
+def assembled_demo(name: str) -> bytes:
+    """Машинный код демо-программы; ассемблируется один раз на имя"""
+    return ProgramLoader().assemble_simple(list(get_demo_by_name(name)))
 
 
+@functools.cache
+def formatted_listing(name: str) -> str:
+    """Листинг демо-программы с адресами команд (как печатается в main.py)"""
+    return "\n".join(
+        f"  {i * 4:3d}: {line}" for i, line in enumerate(get_demo_by_name(name))
+    )
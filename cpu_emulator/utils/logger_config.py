@@ -12,22 +12,48 @@ from loguru import logger
 LOG_FORMAT = (
     "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}"
 )
+# Цветной формат для консоли (только если stdout — терминал)
+CONSOLE_COLOR_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
 
 SETUP_COMPLETE = False
 
+# Корень проекта и каталог логов вычисляются один раз при импорте
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_LOG_DIR = _PROJECT_ROOT / "logs"
+
 
 def get_project_root() -> Path:
     """Получает корень проекта"""
-    return Path(__file__).parent.parent.parent
+    return _PROJECT_ROOT
 
 
 def setup_logger(log_level: str = "DEBUG") -> None:
+    """
+    Настраивает sinks логгера (повторные вызовы игнорируются)
+
+    Дорогие сообщения в горячих местах лучше формировать лениво, например:
+    logger.opt(lazy=True).debug("state: {}", lambda: cpu.get_state())
+    """
     global SETUP_COMPLETE
+    if SETUP_COMPLETE:
+        return
     logger.remove()
 
-    project_root = get_project_root()
-    log_dir = project_root / "logs"
-    log_dir.mkdir(exist_ok=True)
+    mode = (
+        "production"
+        if os.getenv("ENVIRONMENT", "development") == "production"
+        else "development"
+    )
+    # Расширенные трейсбеки (разбор кадров и значений переменных) — только при разработке
+    verbose_traces = mode == "development"
+
+    # Каталог создаётся один раз: повторные вызовы отсекает SETUP_COMPLETE
+    _LOG_DIR.mkdir(exist_ok=True)
 
     if not log_level:
         log_level = (
@@ -36,33 +62,28 @@ def setup_logger(log_level: str = "DEBUG") -> None:
             else "DEBUG"
         )
 
+    # В пайп/CI пишем без ANSI-цветов
+    is_tty = sys.stdout.isatty()
     logger.add(
         sys.stdout,
         level=log_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>",
-        colorize=True,
+        format=CONSOLE_COLOR_FORMAT if is_tty else LOG_FORMAT,
+        colorize=is_tty,
         enqueue=True,
     )
 
     # Handler для файла с ротацией
     logger.add(
-        "logs/cpu_emulator_{time:YYYY-MM-DD}.log",
+        str(_LOG_DIR / "cpu_emulator_{time:YYYY-MM-DD}.log"),
         level="DEBUG",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+        format=LOG_FORMAT,
         rotation="10 MB",
         retention="7 days",
         compression="zip",
         enqueue=True,
-        backtrace=True,
-        diagnose=True,
+        backtrace=verbose_traces,
+        diagnose=verbose_traces,
     )
 
-    mode = (
-        "production"
-        if os.getenv("ENVIRONMENT", "development") == "production"
-        else "development"
-    )
+    SETUP_COMPLETE = True
     logger.info(f"🚀 Логгер настроен для {mode} режима")
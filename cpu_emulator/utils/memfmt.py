@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import struct
+
+# Таблица для ASCII-колонки дампа: непечатаемые байты заменяются на "."
+_PRINTABLE = bytes(c if 32 <= c < 127 else ord(".") for c in range(256))
+# Готовые hex-представления байтов "00".."FF"
+_HEX = tuple(f"{i:02X}" for i in range(256))
+
+
+def format_byte_rows(buf: bytes, start: int, base: int, rows: int) -> list[str]:
+    """
+    Строки hex-дампа по 16 байт: адрес, байты и ASCII-колонка
+    :param buf: прочитанные байты памяти, начиная с адреса start
+    :param start: адрес первого байта buf
+    :param base: адрес первой строки (выравнен на 16)
+    :param rows: количество строк
+    :return: список строк дампа
+    """
+    # Весь буфер переводится в hex и ASCII за два вызова, строки — срезы
+    hex_all = buf.hex(" ").upper()
+    ascii_all = buf.translate(_PRINTABLE).decode("latin-1")
+    size = len(buf)
+    lines: list[str] = []
+    for row in range(rows):
+        row_addr = base + row * 16
+        offset = row_addr - start
+        if 0 <= offset and offset + 16 <= size:
+            hex_part = hex_all[offset * 3 : offset * 3 + 47]
+            ascii_part = ascii_all[offset : offset + 16]
+        else:
+            # Строка выходит за пределы памяти: недоступные байты как "??"
+            chunk = buf[offset : offset + 16] if offset >= 0 else b""
+            missing = 16 - len(chunk)
+            hex_part = " ".join([_HEX[b] for b in chunk] + ["??"] * missing)
+            ascii_part = chunk.translate(_PRINTABLE).decode("latin-1") + "." * missing
+        lines.append(f"0x{row_addr & 0xFFFFFFFF:05X}: {hex_part:<47}  {ascii_part}")
+    return lines
+
+
+def format_word_rows(buf: bytes, start: int, base: int, rows: int) -> list[str]:
+    """
+    Строки дампа по одному 32-битному слову (little endian)
+    :param buf: прочитанные байты памяти, начиная с адреса start
+    :param start: адрес первого байта buf
+    :param base: адрес первой строки (выравнен на 4)
+    :param rows: количество строк
+    :return: список строк дампа; слова вне памяти — "<err>"
+    """
+    lead = (start - base) // 4
+    full = len(buf) // 4
+    words = [w for (w,) in struct.iter_unpack("<I", buf[: full * 4])]
+    lines: list[str] = []
+    for row in range(rows):
+        addr = (base + row * 4) & 0xFFFFFFFF
+        k = row - lead
+        if 0 <= k < full:
+            lines.append(f"0x{addr:05X}: 0x{words[k]:08X}")
+        else:
+            lines.append(f"0x{addr:05X}: <err>")
+    return lines
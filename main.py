@@ -1,123 +1,114 @@
 import argparse
+import sys
 
 from cpu_emulator.core.cpu import CPU
-from cpu_emulator.core.program_loader import ProgramLoader
 from cpu_emulator.utils.logger_config import setup_logger
 from cpu_emulator.gui import run_gui
-from cpu_emulator.utils.demo_programs import (
-    program_array_sum,
-    program_convolution,
-    program_long_arithmetic,
-    program_array_sum_long,
-)
+from cpu_emulator.utils.demo_programs import assembled_demo, formatted_listing
 
-setup_logger(log_level="INFO")
 
+REG_TMPL = "    {name}: {v:10d} (0x{v:08X})"
 
-def print_cpu_state(cpu: CPU):
-    """Вывод состояния CPU"""
-    state = cpu.get_state()
-
-    print("  Регистры:")
-    for i in range(8):
-        print(
-            f"    R{i}: {state['registers'][f'R{i}']:10d} (0x{state['registers'][f'R{i}']:08X})"
-        )
 
+def format_cpu_state(cpu: CPU) -> str:
+    """Текстовое представление состояния CPU"""
+    registers = cpu.registers
+    flags = cpu.flags
+    lines = ["  Регистры:"]
+    lines.extend(REG_TMPL.format(name=f"R{i}", v=registers[i]) for i in range(8))
     # В RISC-V стиле SP доступен как R8
-    print(
-        f"    R8 (SP): {state['registers']['R8']:10d} (0x{state['registers']['R8']:08X})"
-    )
+    lines.append(REG_TMPL.format(name="R8 (SP)", v=registers[8]))
+    lines.append("  Специальные регистры:")
+    lines.append(f"    PC: 0x{registers.pc:05X}")
+    lines.append("  Флаги:")
+    lines.append("    " + " ".join(f"{flag}={flags[flag]}" for flag in ("Z", "S", "C", "O", "P")))
+    lines.append(f"  Состояние: running={cpu.running}, halted={cpu.halted}")
+    return "\n".join(lines)
 
-    print("  Специальные регистры:")
-    print(f"    PC: 0x{state['pc']:05X}")
 
-    print("  Флаги:")
-    flags_str = " ".join([f"{flag}={value}" for flag, value in state["flags"].items()])
-    print(f"    {flags_str}")
+def _render_demo(lines: list[str]) -> str:
+    """Вывод демонстрации целиком: одна запись в stdout вместо print на каждую строку"""
+    return "\n".join(lines) + "\n"
 
-    print(f"  Состояние: running={state['running']}, halted={state['halted']}")
 
+def _prepare_cpu(cpu: CPU | None) -> CPU:
+    """Новый CPU или сброс переданного вместе с памятью, чтобы не выделять её заново"""
+    if cpu is None:
+        return CPU()
+    cpu.reset(clear_memory=True)
+    return cpu
 
-def demo_array_sum():
-    """Демонстрация программы суммирования массива"""
-    print("\n=== Программа: Сумма элементов массива ===")
 
-    cpu = CPU()
-    loader = ProgramLoader()
+def demo_array_sum(cpu: CPU | None = None):
+    """Демонстрация программы суммирования массива"""
+    out: list[str] = []
+    out.append("\n=== Программа: Сумма элементов массива ===")
 
-    program_assembly = program_array_sum()
+    cpu = _prepare_cpu(cpu)
 
-    print("Программа суммирования массива [10, 20, 30, 40, 50]:")
-    for i, line in enumerate(program_assembly):
-        addr = i * 4
-        print(f"  {addr:3d}: {line}")
+    out.append("Программа суммирования массива [10, 20, 30, 40, 50]:")
+    out.append(formatted_listing("Сумма массива"))
 
-    machine_code = loader.assemble_simple(program_assembly)
+    machine_code = assembled_demo("Сумма массива")
     cpu.load_program(machine_code)
 
-    print("\nВыполнение программы...")
+    out.append("\nВыполнение программы...")
     cpu.run(max_cycles=1000)
 
     result = cpu.registers[0]  # Результат в R0
-    print(f"\nРезультат суммирования: {result}")
-    print("Ожидаемый результат: 150 (10+20+30+40+50)")
-    print(f"Правильность: {'✅' if result == 150 else '❌'}")
+    out.append(f"\nРезультат суммирования: {result}")
+    out.append("Ожидаемый результат: 150 (10+20+30+40+50)")
+    out.append(f"Правильность: {'✅' if result == 150 else '❌'}")
 
-    print_cpu_state(cpu)
+    out.append(format_cpu_state(cpu))
+    sys.stdout.write(_render_demo(out))
 
 
-def demo_array_convolution():
+def demo_array_convolution(cpu: CPU | None = None):
     """Демонстрация программы свертки двух массивов"""
-    print("\n=== Программа: Свертка двух массивов ===")
+    out: list[str] = []
+    out.append("\n=== Программа: Свертка двух массивов ===")
 
-    cpu = CPU()
-    loader = ProgramLoader()
+    cpu = _prepare_cpu(cpu)
 
-    # Программа свертки массивов A=[1,2,3,4,5] и B=[5,4,3,2,1]
-    program_assembly = program_convolution()
+    out.append("Программа свертки массивов A=[1,2,3,4,5] и B=[5,4,3,2,1]:")
+    out.append("Вычисляет: A[0]*B[0] + A[1]*B[1] + A[2]*B[2] + A[3]*B[3] + A[4]*B[4]")
+    out.append("         = 1*5 + 2*4 + 3*3 + 4*2 + 5*1 = 5 + 8 + 9 + 8 + 5 = 35")
 
-    print("Программа свертки массивов A=[1,2,3,4,5] и B=[5,4,3,2,1]:")
-    print("Вычисляет: A[0]*B[0] + A[1]*B[1] + A[2]*B[2] + A[3]*B[3] + A[4]*B[4]")
-    print("         = 1*5 + 2*4 + 3*3 + 4*2 + 5*1 = 5 + 8 + 9 + 8 + 5 = 35")
-
-    machine_code = loader.assemble_simple(program_assembly)
+    machine_code = assembled_demo("Свертка массивов")
     cpu.load_program(machine_code)
 
-    print("\nВыполнение программы...")
+    out.append("\nВыполнение программы...")
     cpu.run(max_cycles=400)
 
     result = cpu.registers[0]  # Результат в R0
-    print(f"\nРезультат свертки: {result}")
-    print("Ожидаемый результат: 35")
-    print(f"Правильность: {'✅' if result == 35 else '❌'}")
+    out.append(f"\nРезультат свертки: {result}")
+    out.append("Ожидаемый результат: 35")
+    out.append(f"Правильность: {'✅' if result == 35 else '❌'}")
 
-    print_cpu_state(cpu)
+    out.append(format_cpu_state(cpu))
+    sys.stdout.write(_render_demo(out))
 
 
-def demo_long_arithmetic():
+def demo_long_arithmetic(cpu: CPU | None = None):
     """Демонстрация длинной арифметики - сложение 64-битных чисел"""
-    print("\n=== Программа: Длинная арифметика (64-битные числа) ===")
-    
-    cpu = CPU()
-    loader = ProgramLoader()
+    out: list[str] = []
+    out.append("\n=== Программа: Длинная арифметика (64-битные числа) ===")
     
-    program_assembly = program_long_arithmetic()
+    cpu = _prepare_cpu(cpu)
     
-    print("Программа сложения 64-битных чисел:")
-    print("A = 0x00000001FFFFFFFF")
-    print("B = 0x0000000000000001")
-    print("Ожидаемый результат: 0x0000000200000000")
-    print()
+    out.append("Программа сложения 64-битных чисел:")
+    out.append("A = 0x00000001FFFFFFFF")
+    out.append("B = 0x0000000000000001")
+    out.append("Ожидаемый результат: 0x0000000200000000")
+    out.append("")
     
-    for i, line in enumerate(program_assembly):
-        addr = i * 4
-        print(f"  {addr:3d}: {line}")
+    out.append(formatted_listing("Длинная арифметика"))
     
-    machine_code = loader.assemble_simple(program_assembly)
+    machine_code = assembled_demo("Длинная арифметика")
     cpu.load_program(machine_code)
     
-    print("\nВыполнение программы...")
+    out.append("\nВыполнение программы...")
     cpu.run(max_cycles=50)
     
     # Получаем результат
@@ -128,62 +119,65 @@ def demo_long_arithmetic():
     result_64bit = (result_high << 32) | result_low
     expected = 0x0000000200000000
     
-    print(f"\nРезультат длинного сложения:")
-    print(f"  R0 (младшие 32 бита): 0x{result_low:08X}")
-    print(f"  R1 (старшие 32 бита): 0x{result_high:08X}")
-    print(f"  Полный 64-битный результат: 0x{result_64bit:016X}")
-    print(f"  Ожидаемый результат:        0x{expected:016X}")
-    print(f"  Правильность: {'✅' if result_64bit == expected else '❌'}")
+    out.append(f"\nРезультат длинного сложения:")
+    out.append(f"  R0 (младшие 32 бита): 0x{result_low:08X}")
+    out.append(f"  R1 (старшие 32 бита): 0x{result_high:08X}")
+    out.append(f"  Полный 64-битный результат: 0x{result_64bit:016X}")
+    out.append(f"  Ожидаемый результат:        0x{expected:016X}")
+    out.append(f"  Правильность: {'✅' if result_64bit == expected else '❌'}")
     
-    print_cpu_state(cpu)
+    out.append(format_cpu_state(cpu))
+    sys.stdout.write(_render_demo(out))
 
 
-def demo_array_sum_long():
+def demo_array_sum_long(cpu: CPU | None = None):
     """Демонстрация суммирования массива с 64-битным аккумулятором (R1:R0)."""
-    print("\n=== Программа: Сумма элементов массива (64-бит) ===")
+    out: list[str] = []
+    out.append("\n=== Программа: Сумма элементов массива (64-бит) ===")
 
-    cpu = CPU()
-    loader = ProgramLoader()
+    cpu = _prepare_cpu(cpu)
 
-    program_assembly = program_array_sum_long()
-    for i, line in enumerate(program_assembly):
-        addr = i * 4
-        print(f"  {addr:3d}: {line}")
+    out.append(formatted_listing("Сумма массива (64-бит)"))
 
-    machine_code = loader.assemble_simple(program_assembly)
+    machine_code = assembled_demo("Сумма массива (64-бит)")
     cpu.load_program(machine_code)
 
-    print("\nВыполнение программы...")
+    out.append("\nВыполнение программы...")
     cpu.run(max_cycles=400)
 
     result_low = cpu.registers[0] & 0xFFFFFFFF
     result_high = cpu.registers[1] & 0xFFFFFFFF
     result_64 = (result_high << 32) | result_low
     expected = 10 + 20 + 30 + 40 + 50
-    print(f"\nРезультат (R1:R0): 0x{result_high:08X}:0x{result_low:08X} -> 0x{result_64:016X}")
-    print(f"Ожидаемый:          {expected} (0x{expected:016X})")
-    print(f"Правильность: {'✅' if result_64 == expected else '❌'}")
+    out.append(f"\nРезультат (R1:R0): 0x{result_high:08X}:0x{result_low:08X} -> 0x{result_64:016X}")
+    out.append(f"Ожидаемый:          {expected} (0x{expected:016X})")
+    out.append(f"Правильность: {'✅' if result_64 == expected else '❌'}")
 
-    print_cpu_state(cpu)
+    out.append(format_cpu_state(cpu))
+    sys.stdout.write(_render_demo(out))
 
 def main():
     """Главная функция: запуск GUI или демонстраций"""
     parser = argparse.ArgumentParser(description="CPU Emulator")
     parser.add_argument("--gui", action="store_true", help="Run Tkinter GUI")
     args = parser.parse_args()
+    # Логгер настраивается при запуске из CLI, а не при импорте модуля
+    setup_logger(log_level="INFO")
 
     if args.gui:
         run_gui()
         return
 
     try:
+        # Один CPU на все демонстрации: между ними только сброс
+        cpu = CPU()
         # demo_basic_operations()
         # demo_conditional_jumps()
         # demo_stack_operations()
-        demo_array_sum()
-        demo_array_convolution()
-        demo_array_sum_long()
-        # demo_long_arithmetic()
+        demo_array_sum(cpu)
+        demo_array_convolution(cpu)
+        demo_array_sum_long(cpu)
+        # demo_long_arithmetic(cpu)
 
         print("\n=== Демонстрация завершена успешно! ===")
 
@@ -193,13 +187,6 @@ def main():
 
         traceback.print_exc()
 
-        color_dict = {
-            "north": 1,
-            "south": 2,
-            "west": 3,
-        }
-        y = lambda x: color_dict[x]
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,142 @@
+"""
+Эталонная модель 32-битного ALU для сверки в тестах
+Флаги считаются независимо от Flags, через битовые тождества
+Каждая функция возвращает (result, Z, S, C, O, P); флаг, который операция
+не меняет, считается сброшенным
+"""
+
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from loguru import logger
+
+MASK32 = 0xFFFFFFFF
+
+
+def _zsp(result: int) -> tuple[int, int, int]:
+    """Флаги Z, S и P (чётность младшего байта) для результата"""
+    return int(result == 0), result >> 31, ((result & 0xFF).bit_count() & 1) ^ 1
+
+
+def ref_add(a: int, b: int) -> tuple[int, ...]:
+    full = a + b
+    result = full & MASK32
+    z, s, p = _zsp(result)
+    overflow = ((~(a ^ b) & (a ^ result)) >> 31) & 1
+    return result, z, s, full >> 32, overflow, p
+
+
+def ref_sub(a: int, b: int) -> tuple[int, ...]:
+    result = (a - b) & MASK32
+    z, s, p = _zsp(result)
+    overflow = (((a ^ b) & (a ^ result)) >> 31) & 1
+    return result, z, s, int(a < b), overflow, p
+
+
+def _ref_logical(result: int) -> tuple[int, ...]:
+    """Логические операции сбрасывают C и O"""
+    z, s, p = _zsp(result)
+    return result, z, s, 0, 0, p
+
+
+def ref_and(a: int, b: int) -> tuple[int, ...]:
+    return _ref_logical(a & b)
+
+
+def ref_or(a: int, b: int) -> tuple[int, ...]:
+    return _ref_logical(a | b)
+
+
+def ref_xor(a: int, b: int) -> tuple[int, ...]:
+    return _ref_logical(a ^ b)
+
+
+def ref_not(a: int) -> tuple[int, ...]:
+    return _ref_logical(a ^ MASK32)
+
+
+def ref_mul(a: int, b: int) -> tuple[int, ...]:
+    full = a * b
+    result = full & MASK32
+    z, s, p = _zsp(result)
+    return result, z, s, int(full > MASK32), 0, p
+
+
+def ref_div(a: int, b: int) -> tuple[tuple[int, int], int, int, int, int, int]:
+    """Деление сдвигом и вычитанием (restoring): ((частное, остаток), Z, S, C, O, P) по частному"""
+    quotient = 0
+    remainder = 0
+    for i in range(31, -1, -1):
+        remainder = (remainder << 1) | ((a >> i) & 1)
+        if remainder >= b:
+            remainder -= b
+            quotient |= 1 << i
+    z, s, p = _zsp(quotient)
+    return (quotient, remainder), z, s, 0, 0, p
+
+
+def ref_shift_left(a: int, count: int) -> tuple[int, ...]:
+    """Сдвиг влево на 0..31 позиций: C — последний выдвинутый бит"""
+    result = (a << count) & MASK32
+    z, s, p = _zsp(result)
+    return result, z, s, ((a << count) >> 32) & 1, 0, p
+
+
+def ref_shift_right(a: int, count: int) -> tuple[int, ...]:
+    """Логический сдвиг вправо на 0..31 позиций: C — последний выдвинутый бит"""
+    result = a >> count
+    z, s, p = _zsp(result)
+    return result, z, s, ((a << 1) >> count) & 1, 0, p
+
+
+def ref_arithmetic_shift_right(a: int, count: int) -> tuple[int, ...]:
+    """Арифметический сдвиг вправо: старшие биты заполняются знаком"""
+    sign_fill = (MASK32 << (32 - count)) & MASK32 if a >> 31 else 0
+    result = (a >> count) | sign_fill
+    z, s, p = _zsp(result)
+    return result, z, s, ((a << 1) >> count) & 1, 0, p
+
+
+def ref_rotate_left(a: int, count: int) -> tuple[int, ...]:
+    """Поворот влево: C — младший бит результата; при 0 флаги не меняются"""
+    if not count:
+        return a, 0, 0, 0, 0, 0
+    result = ((a << count) | (a >> (32 - count))) & MASK32
+    z, s, p = _zsp(result)
+    return result, z, s, result & 1, 0, p
+
+
+def ref_rotate_right(a: int, count: int) -> tuple[int, ...]:
+    """Поворот вправо: C — старший бит результата; при 0 флаги не меняются"""
+    if not count:
+        return a, 0, 0, 0, 0, 0
+    result = ((a >> count) | (a << (32 - count))) & MASK32
+    z, s, p = _zsp(result)
+    return result, z, s, result >> 31, 0, p
+
+
+@contextmanager
+def quiet_core_logs() -> Iterator[None]:
+    """Отключает отладочный лог cpu_emulator на время массовой сверки"""
+    logger.disable("cpu_emulator")
+    try:
+        yield
+    finally:
+        logger.enable("cpu_emulator")
+
+
+def random_pairs(
+    seed: int, count: int, b_range: tuple[int, int] = (0, MASK32)
+) -> list[tuple[int, int]]:
+    """
+    Воспроизводимый набор пар операндов
+    :param seed: зерно генератора
+    :param count: количество пар
+    :param b_range: границы второго операнда включительно
+    :return: список пар (a, b)
+    """
+    # Генератор нужен воспроизводимый, не криптостойкий
+    rng = random.Random(seed)  # noqa: S311
+    low, high = b_range
+    return [(rng.getrandbits(32), rng.randint(low, high)) for _ in range(count)]
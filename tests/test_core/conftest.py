@@ -1,29 +1,87 @@
 import pytest
 
+from cpu_emulator.core.alu import ALU
 from cpu_emulator.core.flags import Flags
 from cpu_emulator.core.memory import Memory
 from cpu_emulator.core.registers import Registers
 
 
-@pytest.fixture
-def memory_fabric():
-    def _create(size: int = 8):
-        return Memory(size)
+@pytest.fixture(scope="session")
+def _fabric_pool():
+    """Свободные экземпляры Memory/Registers между тестами: (класс, размер) -> список"""
+    return {}
 
-    return _create
 
+def _pooled_fabric(pool, cls):
+    """
+    Фабрика на один тест: берёт свободный экземпляр из пула и сбрасывает его или создаёт новый
+    Каждый вызов в пределах теста получает отдельный объект; после теста они возвращаются в пул
+    """
+    taken = []
 
-@pytest.fixture
-def registers_fabric():
     def _create(size: int = 8):
-        return Registers(size)
+        free = pool.setdefault((cls, size), [])
+        instance = free.pop() if free else cls(size)
+        instance.reset()
+        taken.append((size, instance))
+        return instance
 
-    return _create
+    yield _create
+    for size, instance in taken:
+        pool[(cls, size)].append(instance)
 
 
 @pytest.fixture
+def memory_fabric(_fabric_pool):
+    yield from _pooled_fabric(_fabric_pool, Memory)
+
+
+@pytest.fixture
+def registers_fabric(_fabric_pool):
+    yield from _pooled_fabric(_fabric_pool, Registers)
+
+
+@pytest.fixture(scope="session")
 def flag_fabric():
     def _create():
         return Flags()
 
     return _create
+
+
+@pytest.fixture
+def flags():
+    return Flags()
+
+
+@pytest.fixture(scope="module")
+def flag_fabric_cached():
+    """Один экземпляр Flags на модуль: фабрика сбрасывает и возвращает его"""
+    flags = Flags()
+
+    def _create():
+        flags.reset()
+        return flags
+
+    return _create
+
+
+def make_alu() -> tuple[ALU, Registers, Flags]:
+    """ALU с собственными регистрами и флагами; без состояния на уровне модуля"""
+    registers = Registers()
+    flags = Flags()
+    alu = ALU(registers, flags)
+    return alu, registers, flags
+
+
+@pytest.fixture(scope="module")
+def alu_with_registers():
+    """ALU с регистрами и флагами, один экземпляр на модуль; состояние сбрасывают сами тесты"""
+    return make_alu()
+
+
+@pytest.fixture(scope="module")
+def alu_setup(alu_with_registers):
+    """Тот же ALU без регистров: (alu, flags)"""
+    alu, _, flags = alu_with_registers
+    return alu, flags
@@ -0,0 +1,95 @@
+import allure
+import pytest
+
+from cpu_emulator.core.cpu import CPU, CPUState
+from cpu_emulator.core.program_loader import ProgramLoader
+from cpu_emulator.utils.demo_programs import assembled_demo, list_demo_names
+
+_STACK_BASE = 256 * 1024 - 1024
+
+# (демо, R0..R8, PC, флаги Z S C O P, количество тактов)
+_DEMO_STATES = (
+    ("Сумма массива", (150, 2020, 50, 0, 0, 0, 0, 0, _STACK_BASE), 100, (1, 0, 0, 0, 1), 49),
+    ("Свертка массивов", (35, 3020, 4020, 5, 1, 0, 0, 0, _STACK_BASE), 176, (1, 0, 0, 0, 1), 80),
+    ("Длинная арифметика", (0, 2, 1, 0, 0, 0, 0, 0, _STACK_BASE), 32, (0, 0, 0, 0, 0), 8),
+    ("Сумма массива (64-бит)", (150, 0, 50, 0, 2020, 0, 0, 0, _STACK_BASE), 116, (1, 0, 0, 0, 1), 61),
+)
+
+
+def _run_demo(cpu: CPU, name: str) -> None:
+    cpu.load_program(assembled_demo(name))
+    cpu.run(max_cycles=1000)
+
+
+@allure.parent_suite("Тесты эмулятора")
+@allure.suite("Тесты ядра")
+@allure.sub_suite("Тесты CPU")
+class TestCPU:
+    @allure.title("Состояние CPU после инициализации")
+    def test_initial_state(self):
+        state = CPU().get_state()
+        assert isinstance(state, CPUState)
+        assert state == CPUState(
+            registers=(0,) * 8 + (_STACK_BASE,),
+            pc=0,
+            sp=_STACK_BASE,
+            flags=(0, 0, 0, 0, 0),
+            running=False,
+            halted=False,
+            cycle_count=0,
+        )
+
+    @pytest.mark.parametrize("case", _DEMO_STATES)
+    @allure.title("Состояние CPU после демо-программы")
+    def test_demo_state(self, case):
+        name, registers, pc, flags, cycles = case
+        cpu = CPU()
+        _run_demo(cpu, name)
+        state = cpu.get_state()
+        assert state.registers == registers
+        assert state.pc == pc
+        assert state.sp == _STACK_BASE
+        assert state.flags == flags == cpu.flags.snapshot()
+        assert (state.running, state.halted) == (False, True)
+        assert state.cycle_count == cycles
+
+    @pytest.mark.parametrize("case", _DEMO_STATES)
+    @allure.title("Повторное использование CPU через reset(clear_memory=True)")
+    def test_reset_clear_memory_matches_fresh(self, case):
+        name = case[0]
+        fresh = CPU()
+        _run_demo(fresh, name)
+
+        reused = CPU()
+        for other in list_demo_names():
+            _run_demo(reused, other)
+        reused.reset(clear_memory=True)
+        _run_demo(reused, name)
+
+        assert reused.get_state() == fresh.get_state()
+        assert reused.memory.memory == fresh.memory.memory
+
+    @allure.title("reset() без clear_memory сохраняет память")
+    def test_reset_keeps_memory(self):
+        cpu = CPU()
+        _run_demo(cpu, "Сумма массива")
+        before = bytes(cpu.memory.memory)
+        cpu.reset()
+        assert cpu.get_state() == CPU().get_state()
+        assert cpu.memory.memory == before
+        cpu.reset(clear_memory=True)
+        assert cpu.memory.memory == bytes(cpu.memory.size)
+
+    @allure.title("reset(clear_memory=True) обнуляет слова, записанные STORE")
+    def test_reset_clears_stored_words(self):
+        cpu = CPU()
+        cpu.load_program(
+            ProgramLoader().assemble_simple(
+                ["MOV R1, #0x1000", "MOV R2, #-1", "STORE [R1], R2", "PUSH R2", "HALT"]
+            )
+        )
+        cpu.run(max_cycles=100)
+        assert cpu.memory.read_word(0x1000) == 0xFFFFFFFF
+        assert cpu.memory.read_word(_STACK_BASE - 4) == 0xFFFFFFFF
+        cpu.reset(clear_memory=True)
+        assert cpu.memory.memory == bytes(cpu.memory.size)
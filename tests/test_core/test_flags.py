@@ -1,8 +1,78 @@
 import allure
 import pytest
 
+from cpu_emulator.core._flag_ops import (
+    STR_TO_ID,
+    arithmetic_flags,
+    shift_left_carry,
+    shift_right_carry,
+)
 from cpu_emulator.core.exceptions import FlagException
-from cpu_emulator.core.flags import Flags
+from cpu_emulator.core.flags import OP_ADD, OP_CMP, OP_SUB
+
+# Идентификаторы параметризованных случаев
+_PARITY_IDS = (
+    "8bits",
+    "4bits",
+    "3bits",
+    "1bit",
+    "0bits",
+    "2bits",
+    "3bits_alt",
+    "4bits_alt",
+)
+_MUL_IDS = ("no_carry", "carry", "zero", "negative", "max_carry")
+_DIV_IDS = ("nonzero", "zero", "negative", "max")
+_SHL_IDS = ("with_carry", "zero_count", "negative", "one", "no_carry")
+_SHR_IDS = ("with_carry", "zero_count", "one_to_zero", "two", "max_number")
+_ROTATE_IDS = ("with_carry", "zero", "negative", "max_positive")
+
+# (value, Z, S, P, описание)
+_BASIC_CASES = (
+    (0x00000000, 1, 0, 1, "нулевой результат"),
+    (0x80000000, 0, 1, 1, "отрицательный результат"),
+    (0x12345678, 0, 0, 1, "положительный результат"),
+    (0x7FFFFFFF, 0, 0, 1, "максимальное положительное"),
+    (0xFFFFFFFF, 0, 1, 1, "все биты установлены"),
+    (0x00000001, 0, 0, 0, "единица (нечетная четность)"),
+    (0x00000003, 0, 0, 1, "три (четная четность)"),
+)
+
+# (a, b, операция, Z, S, C, O, описание)
+_ARITH_CASES = (
+    # Тесты сложения
+    (0x10000000, 0x20000000, "ADD", 0, 0, 0, 0, "ADD: без переполнения"),
+    (0xFFFFFFFF, 0x00000001, "ADD", 1, 0, 1, 0, "ADD: с переносом"),
+    (0x7FFFFFFF, 0x00000001, "ADD", 0, 1, 0, 1, "ADD: с переполнением"),
+    (0x80000000, 0x80000000, "ADD", 1, 0, 1, 1, "ADD: отрицательных"),
+    # Тесты вычитания
+    (0x00000001, 0x00000002, "SUB", 0, 1, 1, 0, "SUB: с займом"),
+    (0x20000000, 0x10000000, "SUB", 0, 0, 0, 0, "SUB: без займа"),
+    (0x80000000, 0x00000001, "SUB", 0, 0, 0, 1, "SUB: с переполнением"),
+    (0x12345678, 0x12345678, "SUB", 1, 0, 0, 0, "SUB: равных чисел"),
+    # Тесты сравнения
+    (0x100, 0x100, "CMP", 1, 0, 0, 0, "CMP: равные числа"),
+    (0x50, 0x100, "CMP", 0, 1, 1, 0, "CMP: меньшее с большим"),
+    (0x100, 0x50, "CMP", 0, 0, 0, 0, "CMP: большее с меньшим"),
+    (0x80000000, 0x00000001, "CMP", 0, 0, 0, 1, "CMP: с переполнением"),
+    (0x00000000, 0x80000001, "CMP", 0, 0, 1, 0, "CMP: разность вне 32 бит"),
+)
+
+
+@pytest.fixture(params=("method", "pure"))
+def arith_fn(request, flag_fabric_cached):
+    """Вычисление арифметических флагов через Flags.arithmetic_update или чистую функцию"""
+    if request.param == "pure":
+        return lambda a, b, result, operation: arithmetic_flags(
+            a, b, result, STR_TO_ID[operation]
+        )
+
+    def _via_method(a, b, result, operation):
+        flags = flag_fabric_cached()
+        flags.arithmetic_update(a, b, result, operation)
+        return flags.snapshot()
+
+    return _via_method
 
 
 @allure.parent_suite("Тесты эмулятора")
@@ -11,23 +81,31 @@ from cpu_emulator.core.flags import Flags
 class TestFlags:
     @allure.title("Инициализация флагов")
     @allure.description("Проверяет правильность инициализации всех флагов процессора")
-    def test_init(self):
+    def test_init(self, flags):
         """Тест инициализации флагов"""
-        flags = Flags()
         assert flags.flags["Z"] == 0
         assert flags.flags["S"] == 0
         assert flags.flags["C"] == 0
         assert flags.flags["O"] == 0
         assert flags.flags["P"] == 0
+        assert flags.snapshot() == (0, 0, 0, 0, 0)
+
+    @allure.title("Словарь flags только для чтения")
+    @allure.description(
+        "Проверяет, что запись через flags.flags отклоняется и не меняет флаги"
+    )
+    def test_flags_view_read_only(self, flags):
+        """Тест запрета записи через снимок flags.flags"""
+        with pytest.raises(TypeError):
+            flags.flags["Z"] = 1
+        assert flags.Z == 0
 
     @allure.title("Установка и чтение флагов")
     @allure.description(
         "Проверяет корректность операций установки и чтения значений флагов"
     )
-    def test_get_set_flags(self):
+    def test_get_set_flags(self, flags):
         """Тест установки и чтения флагов"""
-        flags = Flags()
-
         flags.set("Z", 1)
         assert flags.get("Z") == 1
 
@@ -38,49 +116,28 @@ class TestFlags:
     @allure.description(
         "Проверяет корректность обработки ошибок при работе с несуществующими флагами"
     )
-    def test_invalid_flag(self):
+    def test_invalid_flag(self, flags):
         """Тест обработки неизвестного флага"""
-        flags = Flags()
-
         with pytest.raises(FlagException):
             flags.get("X")
 
         with pytest.raises(FlagException):
             flags.set("Y", 1)
 
-    @pytest.mark.parametrize(
-        "value, expected_z, expected_s, expected_p, description",
-        [
-            (0x00000000, 1, 0, 1, "нулевой результат"),
-            (0x80000000, 0, 1, 1, "отрицательный результат"),
-            (0x12345678, 0, 0, 1, "положительный результат"),
-            (0x7FFFFFFF, 0, 0, 1, "максимальное положительное"),
-            (0xFFFFFFFF, 0, 1, 1, "все биты установлены"),
-            (0x00000001, 0, 0, 0, "единица (нечетная четность)"),
-            (0x00000003, 0, 0, 1, "три (четная четность)"),
-        ],
-        ids=[
-            "zero",
-            "negative",
-            "positive",
-            "max_positive",
-            "all_bits",
-            "odd_parity",
-            "even_parity",
-        ],
-    )
-    @allure.title("Базовое обновление флагов: {description}")
+    @allure.title("Базовое обновление флагов")
     @allure.description(
         "Проверяет правильность установки флагов Z, S, P при базовом обновлении"
     )
-    def test_basic_update(self, value, expected_z, expected_s, expected_p, description):
-        """Тест базового обновления флагов"""
-        flags = Flags()
-        flags.basic_update(value)
+    def test_basic_update(self, flags):
+        """Тест базового обновления флагов по таблице _BASIC_CASES"""
+        for value, expected_z, expected_s, expected_p, description in _BASIC_CASES:
+            flags.reset()
+            flags.basic_update(value)
 
-        assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
-        assert flags["S"] == expected_s, f"Sign flag failed for {description}"
-        assert flags["P"] == expected_p, f"Parity flag failed for {description}"
+            z, s, _, _, p = flags.snapshot()
+            assert (z, s, p) == (expected_z, expected_s, expected_p), (
+                f"Flags failed for {description}"
+            )
 
     @pytest.mark.parametrize(
         "value, expected_parity, description",
@@ -94,128 +151,103 @@ class TestFlags:
             (0x15, 0, "3 единицы (0x15)"),
             (0x55, 1, "4 единицы (0x55)"),
         ],
-        ids=[
-            "8bits",
-            "4bits",
-            "3bits",
-            "1bit",
-            "0bits",
-            "2bits",
-            "3bits_alt",
-            "4bits_alt",
-        ],
+        ids=_PARITY_IDS,
     )
     @allure.title("Вычисление четности: {description}")
     @allure.description(
         "Проверяет правильность вычисления флага четности для различных значений"
     )
-    def test_parity_calculation(self, value, expected_parity, description):
+    def test_parity_calculation(self, flags, value, expected_parity, description):
         """Тест вычисления четности"""
-        flags = Flags()
         assert flags._calculate_parity(value) == expected_parity, (
             f"Failed for {description}"
         )
 
-    @pytest.mark.parametrize(
-        "a, b, operation, expected_z, expected_s, expected_c, expected_o, description",
-        [
-            # Тесты сложения
-            (0x10000000, 0x20000000, "ADD", 0, 0, 0, 0, "ADD: без переполнения"),
-            (0xFFFFFFFF, 0x00000001, "ADD", 1, 0, 1, 0, "ADD: с переносом"),
-            (0x7FFFFFFF, 0x00000001, "ADD", 0, 1, 0, 1, "ADD: с переполнением"),
-            (0x80000000, 0x80000000, "ADD", 1, 0, 1, 1, "ADD: отрицательных"),
-            # Тесты вычитания
-            (0x00000001, 0x00000002, "SUB", 0, 1, 1, 0, "SUB: с займом"),
-            (0x20000000, 0x10000000, "SUB", 0, 0, 0, 0, "SUB: без займа"),
-            (0x80000000, 0x00000001, "SUB", 0, 0, 0, 1, "SUB: с переполнением"),
-            (0x12345678, 0x12345678, "SUB", 1, 0, 0, 0, "SUB: равных чисел"),
-            # Тесты сравнения
-            (0x100, 0x100, "CMP", 1, 0, 0, 0, "CMP: равные числа"),
-            (0x50, 0x100, "CMP", 0, 1, 1, 0, "CMP: меньшее с большим"),
-            (0x100, 0x50, "CMP", 0, 0, 0, 0, "CMP: большее с меньшим"),
-        ],
-        ids=[
-            "add_normal",
-            "add_carry",
-            "add_overflow",
-            "add_negative",
-            "sub_borrow",
-            "sub_normal",
-            "sub_overflow",
-            "sub_equal",
-            "cmp_equal",
-            "cmp_less",
-            "cmp_greater",
-        ],
-    )
-    @allure.title("Арифметическое обновление флагов: {description}")
+    @allure.title("Арифметическое обновление флагов")
     @allure.description(
         "Проверяет правильность обновления флагов при арифметических операциях и сравнении"
     )
-    def test_arithmetic_update(
-        self,
-        a,
-        b,
-        operation,
-        expected_z,
-        expected_s,
-        expected_c,
-        expected_o,
-        description,
-    ):
-        """Тест арифметического обновления флагов"""
-        flags = Flags()
-        if operation == "ADD":
-            result = (a + b) & 0xFFFFFFFF
-        elif operation in ["SUB", "CMP"]:
-            result = (a - b) & 0xFFFFFFFF
+    def test_arithmetic_update(self, arith_fn):
+        """Тест арифметического обновления флагов по таблице _ARITH_CASES"""
+        for a, b, operation, *expected, description in _ARITH_CASES:
+            if operation == "ADD":
+                result = (a + b) & 0xFFFFFFFF
+            else:
+                result = (a - b) & 0xFFFFFFFF
 
-        flags.arithmetic_update(a, b, result, operation)
+            flags = arith_fn(a, b, result, operation)
 
-        assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
-        assert flags["S"] == expected_s, f"Sign flag failed for {description}"
-        assert flags["C"] == expected_c, f"Carry flag failed for {description}"
-        assert flags["O"] == expected_o, f"Overflow flag failed for {description}"
+            assert flags[:4] == tuple(expected), f"Flags failed for {description}"
+
+    @allure.title("Неизвестная арифметическая операция")
+    @allure.description(
+        "Проверяет, что arithmetic_update отклоняет неизвестную операцию, не меняя флаги"
+    )
+    def test_invalid_arithmetic_operation(self, flags):
+        """Тест обработки неизвестной арифметической операции"""
+        with pytest.raises(FlagException):
+            flags.arithmetic_update(1, 2, 3, "MUL")
+        with pytest.raises(FlagException):
+            flags.arithmetic_update(1, 2, 3, 3)
+        with pytest.raises(FlagException):
+            flags.arithmetic_update(1, 2, 3, -1)
+        with pytest.raises(FlagException):
+            arithmetic_flags(1, 2, 3, 3)
+        assert flags.snapshot() == (0, 0, 0, 0, 0)
+
+    @allure.title("Арифметическое обновление по идентификатору операции")
+    @allure.description(
+        "Проверяет, что OP_ADD, OP_SUB и OP_CMP, в том числе через update_arith, "
+        "дают те же флаги, что и имена операций"
+    )
+    def test_arithmetic_update_by_id(self, flags):
+        """Тест совпадения флагов для OP_* и строковых имен по таблице _ARITH_CASES"""
+        op_ids = {"ADD": OP_ADD, "SUB": OP_SUB, "CMP": OP_CMP}
+        for a, b, operation, *_, description in _ARITH_CASES:
+            result = (a + b if operation == "ADD" else a - b) & 0xFFFFFFFF
+            flags.reset()
+            flags.arithmetic_update(a, b, result, operation)
+            by_name = flags.snapshot()
+
+            flags.reset()
+            flags.arithmetic_update(a, b, result, op_ids[operation])
+            assert flags.snapshot() == by_name, f"Flags failed for {description}"
+
+            flags.reset()
+            flags.update_arith(a, b, result, op_ids[operation])
+            assert flags.snapshot() == by_name, f"Flags failed for {description}"
 
     @allure.title("Логическое обновление флагов")
     @allure.description(
         "Проверяет правильность обновления флагов при логических операциях"
     )
-    def test_logical_update(self):
+    def test_logical_update(self, flags):
         """Тест обновления флагов для логических операций"""
-        flags = Flags()
         result = 0x12345678
 
         flags.logical_update(result)
 
-        assert flags["Z"] == 0  # Результат не ноль
-        assert flags["S"] == 0  # Результат положительный
-        assert flags["C"] == 0  # Логические операции сбрасывают C
-        assert flags["O"] == 0  # Логические операции сбрасывают O
+        # Результат ненулевой и положительный, логические операции сбрасывают C и O
+        assert flags.snapshot()[:4] == (0, 0, 0, 0)
 
     @allure.title("Обновление флагов при сдвиге")
     @allure.description("Проверяет правильность обновления флагов при операциях сдвига")
-    def test_shift_update(self):
+    def test_shift_update(self, flags):
         """Тест обновления флагов для операций сдвига"""
-        flags = Flags()
         result = 0x12345678
         carry_out = 1
 
         flags.shift_update(result, carry_out)
 
-        assert flags["Z"] == 0  # Результат не ноль
-        assert flags["S"] == 0  # Результат положительный
-        assert flags["C"] == 1  # Перенос из сдвига
-        assert flags["O"] == 0  # Сдвиги сбрасывают O
+        # Результат ненулевой и положительный, C — перенос из сдвига, O сбрасывается
+        assert flags.snapshot()[:4] == (0, 0, 1, 0)
 
     @allure.title("Сброс всех флагов")
     @allure.description(
         "Проверяет правильность сброса всех флагов в исходное состояние"
     )
-    def test_reset(self):
+    def test_reset(self, flags):
         """Тест сброса всех флагов"""
-        flags = Flags()
-
         # Устанавливаем все флаги
         for flag in flags.flags:
             flags.set(flag, 1)
@@ -236,17 +268,22 @@ class TestFlags:
             (0x80000000, 0x80000000, 0, 0, "умножение с отрицательным результатом"),
             (0xFFFFFFFF, 0x1FFFFFFFE, 0, 1, "умножение с максимальным переносом"),
         ],
-        ids=["no_carry", "carry", "zero", "negative", "max_carry"],
+        ids=_MUL_IDS,
     )
     @allure.title("Обновление флагов при умножении: {description}")
     @allure.description(
         "Проверяет правильность обновления флагов при операции умножения"
     )
     def test_multiplication_update(
-        self, result, full_result, expected_z, expected_c, description
+        self,
+        flags,
+        result,
+        full_result,
+        expected_z,
+        expected_c,
+        description,
     ):
         """Тест обновления флагов для умножения"""
-        flags = Flags()
         flags.multiplication_update(result, full_result)
 
         assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
@@ -261,13 +298,14 @@ class TestFlags:
             (0x80000000, 0, "деление с отрицательным результатом"),
             (0xFFFFFFFF, 0, "деление с максимальным результатом"),
         ],
-        ids=["nonzero", "zero", "negative", "max"],
+        ids=_DIV_IDS,
     )
     @allure.title("Обновление флагов при делении: {description}")
     @allure.description("Проверяет правильность обновления флагов при операции деления")
-    def test_division_update(self, quotient, expected_z, description):
+    def test_division_update(
+        self, flags, quotient, expected_z, description
+    ):
         """Тест обновления флагов для деления"""
-        flags = Flags()
         flags.division_update(quotient)
 
         assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
@@ -283,15 +321,21 @@ class TestFlags:
             (0x00000001, 1, 0x00000002, 0, 0, "сдвиг влево единицы"),
             (0x40000000, 1, 0x80000000, 0, 0, "сдвиг влево без переноса"),
         ],
-        ids=["with_carry", "zero_count", "negative", "one", "no_carry"],
+        ids=_SHL_IDS,
     )
     @allure.title("Обновление флагов при сдвиге влево: {description}")
     @allure.description("Проверяет правильность обновления флагов при сдвиге влево")
     def test_shift_left_update(
-        self, original, count, result, expected_z, expected_c, description
+        self,
+        flags,
+        original,
+        count,
+        result,
+        expected_z,
+        expected_c,
+        description,
     ):
         """Тест обновления флагов для сдвига влево"""
-        flags = Flags()
         flags.shift_left_update(original, count, result)
 
         assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
@@ -307,15 +351,21 @@ class TestFlags:
             (0x00000002, 1, 0x00000001, 0, 0, "сдвиг вправо двойки"),
             (0xFFFFFFFF, 1, 0x7FFFFFFF, 0, 1, "сдвиг вправо максимального числа"),
         ],
-        ids=["with_carry", "zero_count", "one_to_zero", "two", "max_number"],
+        ids=_SHR_IDS,
     )
     @allure.title("Обновление флагов при сдвиге вправо: {description}")
     @allure.description("Проверяет правильность обновления флагов при сдвиге вправо")
     def test_shift_right_update(
-        self, original, count, result, expected_z, expected_c, description
+        self,
+        flags,
+        original,
+        count,
+        result,
+        expected_z,
+        expected_c,
+        description,
     ):
         """Тест обновления флагов для сдвига вправо"""
-        flags = Flags()
         flags.shift_right_update(original, count, result)
 
         assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
@@ -330,19 +380,37 @@ class TestFlags:
             (0x80000000, 1, 0, 1, "поворот отрицательного числа"),
             (0x7FFFFFFF, 0, 0, 0, "поворот максимального положительного"),
         ],
-        ids=["with_carry", "zero", "negative", "max_positive"],
+        ids=_ROTATE_IDS,
     )
     @allure.title("Обновление флагов при повороте: {description}")
     @allure.description(
         "Проверяет правильность обновления флагов при операциях поворота"
     )
     def test_rotate_update(
-        self, result, carry_out, expected_z, expected_c, description
+        self,
+        flags,
+        result,
+        carry_out,
+        expected_z,
+        expected_c,
+        description,
     ):
         """Тест обновления флагов для поворота"""
-        flags = Flags()
         flags.rotate_update(result, carry_out)
 
         assert flags["Z"] == expected_z, f"Zero flag failed for {description}"
         assert flags["C"] == expected_c, f"Carry flag failed for {description}"
         assert flags["O"] == 0, f"Overflow flag should be 0 for {description}"
+
+    @allure.title("Бит переноса сдвига для всех счетчиков")
+    @allure.description(
+        "Проверяет, что shift_left_carry и shift_right_carry совпадают с явным выбором выдвинутого бита"
+    )
+    def test_shift_carry_all_counts(self):
+        """Тест вычисления переноса сдвига для count 1..40"""
+        for original in (0x00000000, 0x00000001, 0x80000000, 0x12345678, 0xFFFFFFFF):
+            for count in range(1, 41):
+                expected_left = (original >> (32 - count)) & 1 if count <= 32 else 0
+                expected_right = (original >> (count - 1)) & 1
+                assert shift_left_carry(original, count) == expected_left
+                assert shift_right_carry(original, count) == expected_right
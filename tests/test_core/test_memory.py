@@ -3,26 +3,49 @@ import pytest
 
 from cpu_emulator.core.exceptions import BadAddressException
 
+_BYTE_CASES = (
+    (0, 0, False, 0),
+    (-1, 0, True, None),
+    (0, 256, False, 0),
+    (4, -1, False, 255),
+    (3, -3, False, 253),
+    (9, 1024, True, None),
+)
+
+_WORD_CASES = (
+    ((0x4048F5C3, 0x0000002A), 0, False, (0x4048F5C3, 0x0000002A)),
+    ((0x4048F5C3, 0x0000002A), 2, True, None),
+    ((0x4048F5C3, 0x0000002A), 4, True, None),
+)
+
+_RANGE_CASES = (
+    (0, 8, False),
+    (4, 4, False),
+    (2, 0, False),
+    (4, 8, True),
+    (-1, 2, True),
+    (0, -1, True),
+)
+
+# Записи (адрес, значение) перед сбросом
+_RESET_CASES = (
+    (),
+    ((0, 1),),
+    ((2, 0xAA), (5, 0xBB)),
+    ((7, 0xFF), (0, 0x11)),
+)
+
 
 @allure.parent_suite("Тесты эмулятора")
 @allure.suite("Тесты ядра")
 @allure.sub_suite("Тесты памяти")
 class TestMemory:
-    test_data = [
-        (0, 0, False, 0),
-        (-1, 0, True, None),
-        (0, 256, False, 0),
-        (4, -1, False, 255),
-        (3, -3, False, 253),
-        (9, 1024, True, None),
-    ]
-
-    @pytest.mark.parametrize("test_data", test_data)
+    @pytest.mark.parametrize("case", _BYTE_CASES)
     @allure.title("Тест чтения-записи байта в память")
-    def test_read_write_byte(self, memory_fabric, test_data):
+    def test_read_write_byte(self, memory_fabric, case):
         memory = memory_fabric(8)
 
-        address, value, has_error, expected_value = test_data
+        address, value, has_error, expected_value = case
 
         if has_error:
             with pytest.raises(BadAddressException):
@@ -33,16 +56,10 @@ class TestMemory:
             result = memory.read_byte(address)
             assert result == expected_value
 
-    test_data = [
-        ([0x4048F5C3, 0x0000002A], 0, False, [0x4048F5C3, 0x0000002A]),
-        ([0x4048F5C3, 0x0000002A], 2, True, None),
-        ([0x4048F5C3, 0x0000002A], 4, True, None),
-    ]
-
-    @pytest.mark.parametrize("test_data", test_data)
+    @pytest.mark.parametrize("case", _WORD_CASES)
     @allure.title("Тест чтения-записи слов в память")
-    def test_read_write_word(self, memory_fabric, test_data):
-        words, start_address, has_error, expected = test_data
+    def test_read_write_word(self, memory_fabric, case):
+        words, start_address, has_error, expected = case
         memory = memory_fabric(8)
         address = start_address
         if has_error:
@@ -57,3 +74,47 @@ class TestMemory:
                 result = memory.read_word(address)
                 assert result == word
                 address += 4
+
+    @pytest.mark.parametrize("case", _RANGE_CASES)
+    @allure.title("Тест чтения диапазона байт из памяти")
+    def test_read_range(self, memory_fabric, case):
+        address, length, has_error = case
+        memory = memory_fabric(8)
+        for i in range(memory.size):
+            memory.write_byte(i, i + 1)
+        if has_error:
+            with pytest.raises(BadAddressException):
+                memory.read_range(address, length)
+        else:
+            result = memory.read_range(address, length)
+            assert result == bytes(range(address + 1, address + length + 1))
+
+    @pytest.mark.parametrize("writes", _RESET_CASES)
+    @allure.title("Тест сброса памяти")
+    def test_reset(self, memory_fabric, writes):
+        memory = memory_fabric(8)
+        for address, value in writes:
+            memory.write_byte(address, value)
+        memory.reset()
+        assert memory.read_range(0, memory.size) == bytes(8)
+        # повторный сброс после новой записи
+        memory.write_byte(3, 0x42)
+        memory.reset()
+        assert memory.read_range(0, memory.size) == bytes(8)
+
+    @allure.title("Тест обнуления диапазона памяти")
+    def test_clear(self, memory_fabric):
+        memory = memory_fabric(8)
+        for address in range(8):
+            memory.write_byte(address, address + 1)
+        memory.clear(2, 6)
+        assert memory.read_range(0, memory.size) == bytes((1, 2, 0, 0, 0, 0, 7, 8))
+        with pytest.raises(BadAddressException):
+            memory.clear(4, 9)
+
+    @allure.title("Тест независимости двух экземпляров памяти одного размера")
+    def test_independent_instances(self, memory_fabric):
+        first, second = memory_fabric(8), memory_fabric(8)
+        assert first is not second
+        first.write_word(0, 0xDEADBEEF)
+        assert second.read_range(0, second.size) == bytes(8)
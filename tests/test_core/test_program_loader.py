@@ -0,0 +1,105 @@
+import struct
+
+import allure
+import pytest
+
+from cpu_emulator.core.decoder import InstructionDecoder
+from cpu_emulator.core.instruction_set import OpCode
+from cpu_emulator.core.program_loader import ProgramLoader
+
+# (строки исходника, ожидаемые опкоды)
+_SKIP_CASES = (
+    (("", "HALT"), (OpCode.HALT,)),
+    (("   ", "\t", "HALT"), (OpCode.HALT,)),
+    (("; комментарий", "HALT"), (OpCode.HALT,)),
+    (("  ; комментарий с отступом", "NOP", "HALT"), (OpCode.NOP, OpCode.HALT)),
+    ((",,", "HALT"), (OpCode.HALT,)),
+    ((" , , ", "NOP", ","), (OpCode.NOP,)),
+)
+
+# (строка, ожидаемые опкоды) — по одной строке на каждую мнемонику таблицы
+_MNEMONIC_CASES = (
+    ("NOP", (OpCode.NOP,)),
+    ("HALT", (OpCode.HALT,)),
+    ("MOV R1, R2", (OpCode.MOV_REG,)),
+    ("MOV R1, #100", (OpCode.MOV_IMM,)),
+    ("LOAD R1, [R2]", (OpCode.LOAD,)),
+    ("STORE [R1], R2", (OpCode.STORE,)),
+    ("ADD R1, R2", (OpCode.ADD_REG,)),
+    ("ADD R1, #0x10", (OpCode.ADD_IMM,)),
+    ("SUB R1, R2", (OpCode.SUB_REG,)),
+    ("SUB R1, #1", (OpCode.SUB_IMM,)),
+    ("MUL R1, R2", (OpCode.MUL_REG,)),
+    ("MUL R1, #2", (OpCode.MUL_IMM,)),
+    ("DIV R1, R2", (OpCode.DIV_REG,)),
+    ("DIV R1, #2", (OpCode.DIV_IMM,)),
+    ("AND R1, R2", (OpCode.AND_REG,)),
+    ("AND R1, #0xFF", (OpCode.AND_IMM,)),
+    ("OR R1, R2", (OpCode.OR_REG,)),
+    ("OR R1, #1", (OpCode.OR_IMM,)),
+    ("XOR R1, R2", (OpCode.XOR_REG,)),
+    ("XOR R1, #1", (OpCode.XOR_IMM,)),
+    ("NOT R1", (OpCode.NOT,)),
+    ("SHL R1, R2", (OpCode.SHL_REG,)),
+    ("SHL R1, #4", (OpCode.SHL_IMM,)),
+    ("SHR R1, R2", (OpCode.SHR_REG,)),
+    ("SHR R1, #4", (OpCode.SHR_IMM,)),
+    ("SAR R1, R2", (OpCode.SAR_REG,)),
+    ("SAR R1, #4", (OpCode.SAR_IMM,)),
+    ("CMP R1, R2", (OpCode.CMP_REG,)),
+    ("CMP R1, #0", (OpCode.CMP_IMM,)),
+    ("JMP 0x10", (OpCode.JMP,)),
+    ("JZ 16", (OpCode.JZ,)),
+    ("JNZ 0x10", (OpCode.JNZ,)),
+    ("JC 0x10", (OpCode.JC,)),
+    ("JNC 0x10", (OpCode.JNC,)),
+    ("JS 0x10", (OpCode.JS,)),
+    ("JNS 0x10", (OpCode.JNS,)),
+    ("ADDC R1, R2", (OpCode.ADDC_REG,)),
+    ("ADDC R1, #1", (OpCode.ADDC_IMM,)),
+    ("SUBC R1, R2", (OpCode.SUBC_REG,)),
+    ("SUBC R1, #1", (OpCode.SUBC_IMM,)),
+    ("CLC", (OpCode.CLC,)),
+    ("STC", (OpCode.STC,)),
+    ("mov r1, #1", (OpCode.MOV_IMM,)),
+    ("PUSH R1", (OpCode.SUB_IMM, OpCode.STORE)),
+    ("POP R1", (OpCode.LOAD, OpCode.ADD_IMM)),
+)
+
+_ERROR_CASES = (
+    "FOO R1",
+    "MOV R1",
+    "ADD R9, R1",
+    "LOAD R1, R2",
+    "JMP label",
+)
+
+
+def _opcodes(machine_code: bytes) -> tuple[OpCode, ...]:
+    decoder = InstructionDecoder()
+    return tuple(
+        decoder.decode(word).opcode for (word,) in struct.iter_unpack("<I", machine_code)
+    )
+
+
+@allure.parent_suite("Тесты эмулятора")
+@allure.suite("Тесты ядра")
+@allure.sub_suite("Тесты загрузчика программ")
+class TestProgramLoader:
+    @pytest.mark.parametrize("case", _SKIP_CASES)
+    @allure.title("Пропуск пустых строк, комментариев и строк из запятых")
+    def test_skips_empty_lines(self, case):
+        lines, expected = case
+        assert _opcodes(ProgramLoader().assemble_simple(lines)) == expected
+
+    @pytest.mark.parametrize("case", _MNEMONIC_CASES)
+    @allure.title("Ассемблирование по таблице мнемоник")
+    def test_mnemonic_table(self, case):
+        line, expected = case
+        assert _opcodes(ProgramLoader().assemble_simple([line])) == expected
+
+    @pytest.mark.parametrize("line", _ERROR_CASES)
+    @allure.title("Ошибка ассемблирования с номером строки")
+    def test_assembly_error(self, line):
+        with pytest.raises(ValueError, match="Assembly error on line 2"):
+            ProgramLoader().assemble_simple(["NOP", line])
@@ -3,22 +3,22 @@ import pytest
 
 from cpu_emulator.core.exceptions import RegisterException
 
+_REGISTER_CASES = (
+    (0, 256, False, 256),
+    (0x10, -2, False, 4294967294),
+    (0xFF, 10, True, None),
+)
+
 
 @allure.parent_suite("Тесты эмулятора")
 @allure.suite("Тесты ядра")
 @allure.sub_suite("Тесты регистров")
 class TestRegisters:
-    test_data = [
-        (0, 256, False, 256),
-        (0x10, -2, False, 4294967294),
-        (0xFF, 10, True, None),
-    ]
-
-    @pytest.mark.parametrize("test_data", test_data)
+    @pytest.mark.parametrize("case", _REGISTER_CASES)
     @allure.title("Тест чтения-записи в регистры")
-    def test_registers(self, registers_fabric, test_data):
+    def test_registers(self, registers_fabric, case):
         registers = registers_fabric()
-        reg_num, value, has_error, expected = test_data
+        reg_num, value, has_error, expected = case
         if has_error:
             with pytest.raises(RegisterException):
                 registers[reg_num] = value
@@ -0,0 +1,80 @@
+import struct
+
+import allure
+import pytest
+
+from cpu_emulator.core.decoder import InstructionDecoder
+from cpu_emulator.core.instruction_set import OpCode
+from cpu_emulator.core.program_loader import ProgramLoader
+from cpu_emulator.utils.demo_programs import (
+    assembled_demo,
+    formatted_listing,
+    get_demo_by_name,
+    list_demo_names,
+)
+
+_DEMO_NAMES = (
+    "Сумма массива",
+    "Свертка массивов",
+    "Длинная арифметика",
+    "Сумма массива (64-бит)",
+)
+
+# (демо, количество строк, первые две строки листинга)
+_LISTING_CASES = (
+    ("Сумма массива", 25, ("    0: MOV R1, #2000", "    4: MOV R2, #10")),
+    ("Свертка массивов", 44, ("    0: MOV R1, #3000", "    4: MOV R2, #1")),
+    ("Длинная арифметика", 8, ("    0: MOV R0, #-1", "    4: MOV R1, #1")),
+    ("Сумма массива (64-бит)", 29, ("    0: MOV R1, #2000", "    4: MOV R2, #10")),
+)
+
+# (принятое имя, каноническое имя)
+_ALIAS_CASES = (
+    ("Длинная ариритметика", "Длинная арифметика"),
+    ("Сумма массива", "Сумма массива"),
+)
+
+_UNKNOWN_NAMES = ("", "сумма массива", "Нет такого демо")
+
+
+@allure.parent_suite("Тесты эмулятора")
+@allure.suite("Тесты утилит")
+@allure.sub_suite("Тесты демо-программ")
+class TestDemoPrograms:
+    @allure.title("Список демо в порядке меню")
+    def test_list_demo_names(self):
+        assert list_demo_names() == _DEMO_NAMES
+
+    @pytest.mark.parametrize("case", _LISTING_CASES)
+    @allure.title("Исходник и листинг демо-программы")
+    def test_listing(self, case):
+        name, line_count, head = case
+        lines = get_demo_by_name(name)
+        assert len(lines) == line_count
+        listing = formatted_listing(name).split("\n")
+        assert len(listing) == line_count
+        assert tuple(listing[:2]) == head
+        assert listing[-1] == f"  {(line_count - 1) * 4:3d}: HALT"
+
+    @pytest.mark.parametrize("case", _ALIAS_CASES)
+    @allure.title("Поиск демо по старому написанию имени")
+    def test_alias_lookup(self, case):
+        alias, name = case
+        assert get_demo_by_name(alias) == get_demo_by_name(name)
+        assert assembled_demo(alias) == assembled_demo(name)
+
+    @pytest.mark.parametrize("name", _UNKNOWN_NAMES)
+    @allure.title("Неизвестное имя демо")
+    def test_unknown_demo(self, name):
+        with pytest.raises(KeyError, match="Unknown demo"):
+            get_demo_by_name(name)
+
+    @pytest.mark.parametrize("name", _DEMO_NAMES)
+    @allure.title("Машинный код демо совпадает с прямым ассемблированием")
+    def test_assembled_demo(self, name):
+        machine_code = assembled_demo(name)
+        assert assembled_demo(name) is machine_code
+        assert machine_code == ProgramLoader().assemble_simple(list(get_demo_by_name(name)))
+        assert len(machine_code) == 4 * len(get_demo_by_name(name))
+        (last,) = struct.unpack_from("<I", machine_code, len(machine_code) - 4)
+        assert InstructionDecoder().decode(last).opcode == OpCode.HALT
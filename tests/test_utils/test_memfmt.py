@@ -0,0 +1,108 @@
+import struct
+
+import allure
+import pytest
+
+from cpu_emulator.utils.memfmt import format_byte_rows, format_word_rows
+
+_HEX_0_F = "00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F"
+_HEX_A_P = "41 42 43 44 45 46 47 48 49 4A 4B 4C 4D 4E 4F 50"
+_HEX_MISSING = " ".join(["??"] * 16)
+
+# (буфер, start, base, rows, ожидаемые строки)
+_BYTE_CASES = (
+    (
+        bytes(range(16)) + b"ABCDEFGHIJKLMNOP",
+        0,
+        0,
+        2,
+        (
+            f"0x00000: {_HEX_0_F}  ................",
+            f"0x00010: {_HEX_A_P}  ABCDEFGHIJKLMNOP",
+        ),
+    ),
+    # Неполная последняя строка: недостающие байты как "??" и "."
+    (
+        b"Hi!",
+        0,
+        0,
+        1,
+        ("0x00000: 48 69 21 " + " ".join(["??"] * 13) + "  Hi!" + "." * 13,),
+    ),
+    # Строка до начала прочитанного буфера
+    (
+        b"ABCDEFGHIJKLMNOP",
+        16,
+        0,
+        2,
+        (
+            f"0x00000: {_HEX_MISSING}  ................",
+            f"0x00010: {_HEX_A_P}  ABCDEFGHIJKLMNOP",
+        ),
+    ),
+    # Строки за концом памяти
+    (
+        b"",
+        32,
+        32,
+        1,
+        (f"0x00020: {_HEX_MISSING}  ................",),
+    ),
+    # Адрес шире пяти разрядов не обрезается
+    (
+        bytes(16),
+        0x100000,
+        0x100000,
+        1,
+        ("0x100000: " + " ".join(["00"] * 16) + "  ................",),
+    ),
+)
+
+# (слова, start, base, rows, ожидаемые строки)
+_WORD_CASES = (
+    (
+        (0x4048F5C3, 0x0000002A),
+        0,
+        0,
+        3,
+        ("0x00000: 0x4048F5C3", "0x00004: 0x0000002A", "0x00008: <err>"),
+    ),
+    # Окно начинается раньше прочитанного буфера
+    (
+        (0xDEADBEEF,),
+        8,
+        0,
+        3,
+        ("0x00000: <err>", "0x00004: <err>", "0x00008: 0xDEADBEEF"),
+    ),
+    (
+        (),
+        0x3FFFC,
+        0x3FFFC,
+        2,
+        ("0x3FFFC: <err>", "0x40000: <err>"),
+    ),
+)
+
+
+@allure.parent_suite("Тесты эмулятора")
+@allure.suite("Тесты утилит")
+@allure.sub_suite("Тесты форматирования дампа памяти")
+class TestMemfmt:
+    @pytest.mark.parametrize("case", _BYTE_CASES)
+    @allure.title("Строки байтового дампа")
+    def test_format_byte_rows(self, case):
+        buf, start, base, rows, expected = case
+        assert tuple(format_byte_rows(buf, start, base, rows)) == expected
+
+    @pytest.mark.parametrize("case", _WORD_CASES)
+    @allure.title("Строки дампа по словам")
+    def test_format_word_rows(self, case):
+        words, start, base, rows, expected = case
+        buf = struct.pack(f"<{len(words)}I", *words)
+        assert tuple(format_word_rows(buf, start, base, rows)) == expected
+
+    @allure.title("Неполное слово в конце буфера не выводится")
+    def test_format_word_rows_partial_word(self):
+        buf = struct.pack("<I", 0x12345678) + b"\x01\x02"
+        assert format_word_rows(buf, 0, 0, 2) == ["0x00000: 0x12345678", "0x00004: <err>"]